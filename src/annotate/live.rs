@@ -116,10 +116,9 @@ pub fn handle_annotate_v3(git_ops: &dyn GitOps, input: LiveInput) -> Result<Live
         ));
     }
 
-    let files_changed = {
-        let diffs = git_ops.diff(&full_sha).context(chronicle_error::GitSnafu)?;
-        diffs.into_iter().map(|d| d.path).collect::<Vec<_>>()
-    };
+    let files_changed = git_ops
+        .changed_files(&full_sha)
+        .context(chronicle_error::GitSnafu)?;
 
     let commit_message = git_ops
         .commit_info(&full_sha)
@@ -1,3 +1,4 @@
+use std::collections::HashSet;
 use std::path::Path;
 
 use chrono::{DateTime, Utc};
@@ -5,7 +6,7 @@ use serde::{Deserialize, Serialize};
 
 use crate::error::chronicle_error::{IoSnafu, JsonSnafu};
 use crate::error::Result;
-use crate::git::GitOps;
+use crate::git::{FileDiff, GitOps};
 use crate::schema::v1::{
     self, ContextLevel, CrossCuttingConcern, Provenance, ProvenanceOperation, RegionAnnotation,
 };
@@ -228,6 +229,19 @@ pub fn synthesize_squash_annotation(ctx: &SquashSynthesisContext) -> Annotation
     }
 }
 
+/// Build the `new_diff` text for an amend migration.
+///
+/// Returns an empty string when the amended commit carries exactly the same
+/// changes as the original (a message-only amend). The diffs are compared
+/// structurally, so the debug rendering is only produced when they differ.
+pub fn amend_diff_text(new_diffs: &[FileDiff], old_diffs: &[FileDiff]) -> String {
+    if new_diffs == old_diffs {
+        String::new()
+    } else {
+        format!("{new_diffs:?}")
+    }
+}
+
 /// Migrate an annotation from a pre-amend commit to a post-amend commit.
 ///
 /// If the diff is empty (message-only amend), copies the annotation unchanged
@@ -316,15 +330,15 @@ pub struct SquashSynthesisContextV3 {
 pub fn synthesize_squash_annotation_v3(ctx: &SquashSynthesisContextV3) -> v3::Annotation {
     let mut all_wisdom: Vec<v3::WisdomEntry> = Vec::new();
     let mut source_shas: Vec<String> = Vec::new();
+    // (category, content) keys already merged, so each entry is checked in
+    // constant time rather than against every entry kept so far.
+    let mut seen: HashSet<(&v3::WisdomCategory, &str)> = HashSet::new();
 
     for ann in &ctx.source_annotations {
         source_shas.push(ann.commit.clone());
 
         for entry in &ann.wisdom {
-            let already_exists = all_wisdom
-                .iter()
-                .any(|w| w.category == entry.category && w.content == entry.content);
-            if !already_exists {
+            if seen.insert((&entry.category, entry.content.as_str())) {
                 all_wisdom.push(entry.clone());
             }
         }
@@ -686,6 +700,29 @@ mod tests {
         assert_eq!(result.cross_cutting.len(), 3);
     }
 
+    #[test]
+    fn test_amend_diff_text_empty_only_for_identical_diffs() {
+        use crate::git::{DiffStatus, Hunk, HunkLine};
+
+        let diff = |line: &str| FileDiff {
+            path: "src/foo.rs".to_string(),
+            old_path: None,
+            status: DiffStatus::Modified,
+            hunks: vec![Hunk {
+                old_start: 1,
+                old_count: 1,
+                new_start: 1,
+                new_count: 1,
+                header: "@@ -1 +1 @@".to_string(),
+                lines: vec![HunkLine::Added(line.to_string())],
+            }],
+        };
+
+        assert_eq!(amend_diff_text(&[diff("a")], &[diff("a")]), "");
+        let text = amend_diff_text(&[diff("b")], &[diff("a")]);
+        assert_eq!(text, format!("{:?}", [diff("b")]));
+    }
+
     #[test]
     fn test_migrate_amend_message_only() {
         let old_ann = make_test_annotation("old_sha", "src/foo.rs", "foo_fn");
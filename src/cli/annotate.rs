@@ -1,10 +1,11 @@
 use crate::annotate::squash::{
-    collect_source_annotations_v3, collect_source_messages, migrate_amend_annotation,
-    synthesize_squash_annotation_v3, AmendMigrationContext, SquashSynthesisContextV3,
+    amend_diff_text, collect_source_annotations_v3, collect_source_messages,
+    migrate_amend_annotation, synthesize_squash_annotation_v3, AmendMigrationContext,
+    SquashSynthesisContextV3,
 };
 use crate::error::chronicle_error::{GitSnafu, JsonSnafu};
 use crate::error::Result;
-use crate::git::{CliOps, GitOps};
+use crate::git::{CachedGitOps, CliOps, GitOps};
 use snafu::ResultExt;
 
 pub struct AnnotateArgs {
@@ -69,15 +70,18 @@ pub fn run(args: AnnotateArgs) -> Result<()> {
 
     // --auto: use commit message as summary
     if auto {
-        let full_sha = git_ops.resolve_ref(&commit).context(GitSnafu)?;
-        let commit_info = git_ops.commit_info(&full_sha).context(GitSnafu)?;
+        // handle_annotate_v3 resolves the ref and reads the commit again;
+        // share one cache so those lookups don't re-run git.
+        let cached = CachedGitOps::new(&git_ops);
+        let full_sha = cached.resolve_ref(&commit).context(GitSnafu)?;
+        let commit_info = cached.commit_info(&full_sha).context(GitSnafu)?;
         let input = crate::annotate::live::LiveInput {
             commit,
             summary: commit_info.message,
             wisdom: vec![],
             staged_notes: staged_notes_text.clone(),
         };
-        let result = crate::annotate::live::handle_annotate_v3(&git_ops, input)?;
+        let result = crate::annotate::live::handle_annotate_v3(&cached, input)?;
         let _ = crate::annotate::staging::clear_staged(&git_dir);
         let json = serde_json::to_string_pretty(&result).context(JsonSnafu)?;
         println!("{json}");
@@ -176,13 +180,7 @@ fn run_amend_migration(git_ops: &CliOps, commit: &str, old_sha: &str) -> Result<
     // Compute diff comparison to determine if code changed
     let new_diffs = git_ops.diff(&resolved_commit).context(GitSnafu)?;
     let old_diffs = git_ops.diff(old_sha).context(GitSnafu)?;
-    let new_diff_text = format!("{:?}", new_diffs);
-    let old_diff_text = format!("{:?}", old_diffs);
-    let diff_for_migration = if new_diff_text == old_diff_text {
-        String::new()
-    } else {
-        new_diff_text
-    };
+    let diff_for_migration = amend_diff_text(&new_diffs, &old_diffs);
 
     let ctx = AmendMigrationContext {
         new_commit: resolved_commit.clone(),
@@ -202,6 +200,106 @@ fn run_amend_migration(git_ops: &CliOps, commit: &str, old_sha: &str) -> Result<
     Ok(())
 }
 
+/// Whether the input is a JSON object with a top-level `regions` key, the v1
+/// marker. Key contents are skipped and a repeated key is not an error. Any
+/// non-object probes as "not v1" and is left for the typed decode to reject,
+/// so malformed input reports the same errors as before.
+struct V1Probe {
+    regions: bool,
+}
+
+impl<'de> serde::Deserialize<'de> for V1Probe {
+    fn deserialize<D: serde::Deserializer<'de>>(d: D) -> std::result::Result<Self, D::Error> {
+        d.deserialize_any(V1ProbeVisitor)
+            .map(|regions| V1Probe { regions })
+    }
+}
+
+struct V1ProbeVisitor;
+
+impl<'de> serde::de::Visitor<'de> for V1ProbeVisitor {
+    type Value = bool;
+
+    fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+        f.write_str("any JSON value")
+    }
+
+    fn visit_map<A: serde::de::MapAccess<'de>>(
+        self,
+        mut map: A,
+    ) -> std::result::Result<bool, A::Error> {
+        let mut found = false;
+        while let Some(is_regions) = map.next_key_seed(RegionsKey)? {
+            map.next_value::<serde::de::IgnoredAny>()?;
+            found |= is_regions;
+        }
+        Ok(found)
+    }
+
+    fn visit_seq<A: serde::de::SeqAccess<'de>>(
+        self,
+        mut seq: A,
+    ) -> std::result::Result<bool, A::Error> {
+        while seq.next_element::<serde::de::IgnoredAny>()?.is_some() {}
+        Ok(false)
+    }
+
+    fn visit_bool<E>(self, _: bool) -> std::result::Result<bool, E> {
+        Ok(false)
+    }
+
+    fn visit_i64<E>(self, _: i64) -> std::result::Result<bool, E> {
+        Ok(false)
+    }
+
+    fn visit_u64<E>(self, _: u64) -> std::result::Result<bool, E> {
+        Ok(false)
+    }
+
+    fn visit_f64<E>(self, _: f64) -> std::result::Result<bool, E> {
+        Ok(false)
+    }
+
+    fn visit_str<E>(self, _: &str) -> std::result::Result<bool, E> {
+        Ok(false)
+    }
+
+    fn visit_unit<E>(self) -> std::result::Result<bool, E> {
+        Ok(false)
+    }
+}
+
+/// Map key seed that reports whether the key is `regions` without allocating it.
+struct RegionsKey;
+
+impl<'de> serde::de::DeserializeSeed<'de> for RegionsKey {
+    type Value = bool;
+
+    fn deserialize<D: serde::Deserializer<'de>>(self, d: D) -> std::result::Result<bool, D::Error> {
+        d.deserialize_str(self)
+    }
+}
+
+impl<'de> serde::de::Visitor<'de> for RegionsKey {
+    type Value = bool;
+
+    fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+        f.write_str("an object key")
+    }
+
+    fn visit_str<E>(self, key: &str) -> std::result::Result<bool, E> {
+        Ok(key == "regions")
+    }
+}
+
+/// Decode live input the way it was decoded before the probe existed: through
+/// a `serde_json::Value`, where a repeated key keeps its last value.
+fn decode_live_input_via_value(
+    stdin: &str,
+) -> std::result::Result<crate::annotate::live::LiveInput, serde_json::Error> {
+    serde_json::from_value(serde_json::from_str(stdin)?)
+}
+
 /// Live annotation path: read v3 JSON from stdin, write annotation. Zero LLM cost.
 fn run_live(git_ops: &CliOps) -> Result<()> {
     let stdin = std::io::read_to_string(std::io::stdin()).map_err(|e| {
@@ -211,13 +309,15 @@ fn run_live(git_ops: &CliOps) -> Result<()> {
         }
     })?;
 
-    let value: serde_json::Value =
+    // Probe for the v1 marker without building a full `serde_json::Value`,
+    // then decode the input straight into its typed form.
+    let probe: V1Probe =
         serde_json::from_str(&stdin).map_err(|e| crate::error::ChronicleError::Json {
             source: e,
             location: snafu::Location::default(),
         })?;
 
-    if value.get("regions").is_some() {
+    if probe.regions {
         return Err(crate::error::ChronicleError::Validation {
             message: "v1 annotation format is no longer supported for writing; use v3 format"
                 .to_string(),
@@ -225,8 +325,11 @@ fn run_live(git_ops: &CliOps) -> Result<()> {
         });
     }
 
-    let input: crate::annotate::live::LiveInput =
-        serde_json::from_value(value).map_err(|e| crate::error::ChronicleError::Json {
+    // Input the direct decode rejects (non-objects, repeated keys) goes back
+    // through a `Value` so it gets the same result and error as before.
+    let input: crate::annotate::live::LiveInput = serde_json::from_str(&stdin)
+        .or_else(|_| decode_live_input_via_value(&stdin))
+        .map_err(|e| crate::error::ChronicleError::Json {
             source: e,
             location: snafu::Location::default(),
         })?;
@@ -241,3 +344,51 @@ fn run_live(git_ops: &CliOps) -> Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn probe(input: &str) -> bool {
+        serde_json::from_str::<V1Probe>(input).unwrap().regions
+    }
+
+    #[test]
+    fn test_v1_probe_detects_top_level_regions() {
+        assert!(probe(r#"{"commit":"HEAD","regions":[{"file":"a.rs"}]}"#));
+        assert!(probe(r#"{"regions":null}"#));
+        assert!(probe(r#"{"regions":[],"regions":{}}"#));
+        assert!(!probe(
+            r#"{"commit":"HEAD","summary":"s","wisdom":[{"regions":1}]}"#
+        ));
+    }
+
+    #[test]
+    fn test_v1_probe_leaves_non_objects_to_the_typed_decode() {
+        assert!(!probe(r#"[{"regions":[]}]"#));
+        assert!(!probe(r#""regions""#));
+        assert!(!probe("null"));
+
+        let err = decode_live_input_via_value(r#""regions""#).unwrap_err();
+        assert!(err.to_string().contains("expected struct LiveInput"));
+    }
+
+    #[test]
+    fn test_v1_probe_reports_syntax_errors_like_value() {
+        for input in [r#"{"commit": "#, r#"{"commit":"HEAD"} x"#, ""] {
+            let probe_err = serde_json::from_str::<V1Probe>(input)
+                .map(|p| p.regions)
+                .unwrap_err();
+            let value_err = serde_json::from_str::<serde_json::Value>(input).unwrap_err();
+            assert_eq!(probe_err.to_string(), value_err.to_string());
+        }
+    }
+
+    #[test]
+    fn test_live_input_repeated_key_keeps_last_value() {
+        let input = r#"{"commit":"a","commit":"b","summary":"s"}"#;
+        assert!(serde_json::from_str::<crate::annotate::live::LiveInput>(input).is_err());
+        let decoded = decode_live_input_via_value(input).unwrap();
+        assert_eq!(decoded.commit, "b");
+    }
+}
@@ -1,5 +1,15 @@
 use crate::error::Result;
 use crate::git::CliOps;
+use crate::read::contracts::{ContractEntry, DependencyEntry};
+
+use super::util::anchor_suffix;
+
+/// `--compact` output: just the contracts and dependencies, borrowed.
+#[derive(serde::Serialize)]
+struct CompactContracts<'a> {
+    contracts: &'a [ContractEntry],
+    dependencies: &'a [DependencyEntry],
+}
 
 /// Run the `git chronicle contracts` command.
 pub fn run(path: String, anchor: Option<String>, format: String, compact: bool) -> Result<()> {
@@ -21,11 +31,10 @@ pub fn run(path: String, anchor: Option<String>, format: String, compact: bool)
     match format.as_str() {
         "json" => {
             let json = if compact {
-                let compact_out = serde_json::json!({
-                    "contracts": output.contracts,
-                    "dependencies": output.dependencies,
-                });
-                serde_json::to_string_pretty(&compact_out)
+                serde_json::to_string_pretty(&CompactContracts {
+                    contracts: &output.contracts,
+                    dependencies: &output.dependencies,
+                })
             } else {
                 serde_json::to_string_pretty(&output)
             }
@@ -43,28 +52,20 @@ pub fn run(path: String, anchor: Option<String>, format: String, compact: bool)
             if !output.contracts.is_empty() {
                 println!("Contracts:");
                 for c in &output.contracts {
-                    let anchor_str = c
-                        .anchor
-                        .as_ref()
-                        .map(|a| format!(":{}", a))
-                        .unwrap_or_default();
+                    let (sep, anchor) = anchor_suffix(c.anchor.as_deref());
                     println!(
-                        "  [{}] {}{}: {}",
-                        c.source, c.file, anchor_str, c.description
+                        "  [{}] {}{}{}: {}",
+                        c.source, c.file, sep, anchor, c.description
                     );
                 }
             }
             if !output.dependencies.is_empty() {
                 println!("Dependencies:");
                 for d in &output.dependencies {
-                    let anchor_str = d
-                        .anchor
-                        .as_ref()
-                        .map(|a| format!(":{}", a))
-                        .unwrap_or_default();
+                    let (sep, anchor) = anchor_suffix(d.anchor.as_deref());
                     println!(
-                        "  {}{} -> {}:{} ({})",
-                        d.file, anchor_str, d.target_file, d.target_anchor, d.assumption
+                        "  {}{}{} -> {}:{} ({})",
+                        d.file, sep, anchor, d.target_file, d.target_anchor, d.assumption
                     );
                 }
             }
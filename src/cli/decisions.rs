@@ -1,5 +1,13 @@
 use crate::error::Result;
 use crate::git::CliOps;
+use crate::read::decisions::{DecisionEntry, RejectedAlternativeEntry};
+
+/// `--compact` output: decisions and rejected alternatives, borrowed.
+#[derive(serde::Serialize)]
+struct CompactDecisions<'a> {
+    decisions: &'a [DecisionEntry],
+    rejected_alternatives: &'a [RejectedAlternativeEntry],
+}
 
 /// Run the `git chronicle decisions` command.
 pub fn run(path: Option<String>, format: String, compact: bool) -> Result<()> {
@@ -21,11 +29,10 @@ pub fn run(path: Option<String>, format: String, compact: bool) -> Result<()> {
     match format.as_str() {
         "json" => {
             let json = if compact {
-                let compact_out = serde_json::json!({
-                    "decisions": output.decisions,
-                    "rejected_alternatives": output.rejected_alternatives,
-                });
-                serde_json::to_string_pretty(&compact_out)
+                serde_json::to_string_pretty(&CompactDecisions {
+                    decisions: &output.decisions,
+                    rejected_alternatives: &output.rejected_alternatives,
+                })
             } else {
                 serde_json::to_string_pretty(&output)
             }
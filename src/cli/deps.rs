@@ -1,6 +1,12 @@
 use crate::error::Result;
 use crate::git::CliOps;
-use crate::read::deps::{find_dependents, DepsQuery};
+use crate::read::deps::{find_dependents, DependentEntry, DepsQuery};
+
+/// `--compact` output: only the dependents.
+#[derive(serde::Serialize)]
+struct CompactDeps<'a> {
+    dependents: &'a [DependentEntry],
+}
 
 pub fn run(
     path: String,
@@ -30,10 +36,9 @@ pub fn run(
         })?;
 
     let json = if compact {
-        let compact_out = serde_json::json!({
-            "dependents": result.dependents,
-        });
-        serde_json::to_string_pretty(&compact_out)
+        serde_json::to_string_pretty(&CompactDeps {
+            dependents: &result.dependents,
+        })
     } else if format == "pretty" {
         serde_json::to_string_pretty(&result)
     } else {
@@ -21,6 +21,17 @@ pub fn run(output: Option<String>) -> Result<()> {
             })?;
             let mut writer = BufWriter::new(file);
             let c = export_annotations(&git_ops, &mut writer)?;
+            // export_annotations has flushed the buffer; make the file durable
+            // with a single sync for the whole export. Do not sync per record:
+            // batching all writes ahead of one sync is what keeps large
+            // exports cheap.
+            writer
+                .get_ref()
+                .sync_all()
+                .map_err(|e| crate::error::ChronicleError::Io {
+                    source: e,
+                    location: snafu::Location::default(),
+                })?;
             eprintln!("exported {c} annotations to {path}");
             c
         }
@@ -1,6 +1,12 @@
 use crate::error::Result;
 use crate::git::CliOps;
-use crate::read::history::{build_timeline, HistoryQuery};
+use crate::read::history::{build_timeline, HistoryQuery, TimelineEntry};
+
+/// `--compact` output: only the timeline.
+#[derive(serde::Serialize)]
+struct CompactHistory<'a> {
+    timeline: &'a [TimelineEntry],
+}
 
 pub fn run(
     path: String,
@@ -28,10 +34,9 @@ pub fn run(
         })?;
 
     let json = if compact {
-        let compact_out = serde_json::json!({
-            "timeline": result.timeline,
-        });
-        serde_json::to_string_pretty(&compact_out)
+        serde_json::to_string_pretty(&CompactHistory {
+            timeline: &result.timeline,
+        })
     } else if format == "pretty" {
         serde_json::to_string_pretty(&result)
     } else {
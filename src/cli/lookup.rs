@@ -1,5 +1,32 @@
+use std::io::{BufWriter, Write};
+
 use crate::error::Result;
-use crate::git::CliOps;
+use crate::git::{CachedGitOps, CliOps};
+use crate::read::contracts::{ContractEntry, DependencyEntry};
+use crate::read::decisions::DecisionEntry;
+use crate::read::history::TimelineEntry;
+use crate::read::lookup::{FollowUpEntry, LookupOutput};
+use crate::read::staleness::StalenessInfo;
+use crate::schema::knowledge::FilteredKnowledge;
+
+use super::util::anchor_suffix;
+
+/// The `--compact` JSON shape, borrowed from the full output and serialized
+/// directly instead of being copied into a `serde_json::Value` first.
+/// Only the top-level key order of the old `json!` output is kept (alphabetical).
+/// Nested entries serialize in declaration order, as they do in the full output,
+/// rather than with the sorted keys a `serde_json::Value` would have produced.
+#[derive(serde::Serialize)]
+struct CompactLookup<'a> {
+    contracts: &'a [ContractEntry],
+    decisions: &'a [DecisionEntry],
+    dependencies: &'a [DependencyEntry],
+    #[serde(skip_serializing_if = "Option::is_none")]
+    knowledge: Option<&'a FilteredKnowledge>,
+    open_follow_ups: &'a [FollowUpEntry],
+    recent_history: &'a [TimelineEntry],
+    staleness: &'a [StalenessInfo],
+}
 
 /// Run the `git chronicle lookup` command.
 pub fn run(path: String, anchor: Option<String>, format: String, compact: bool) -> Result<()> {
@@ -8,9 +35,10 @@ pub fn run(path: String, anchor: Option<String>, format: String, compact: bool)
         location: snafu::Location::default(),
     })?;
     let git_ops = CliOps::new(repo_dir);
+    let cached = CachedGitOps::new(&git_ops);
 
     let output =
-        crate::read::lookup::build_lookup(&git_ops, &path, anchor.as_deref()).map_err(|e| {
+        crate::read::lookup::build_lookup(&cached, &path, anchor.as_deref()).map_err(|e| {
             crate::error::ChronicleError::Git {
                 source: e,
                 location: snafu::Location::default(),
@@ -20,18 +48,15 @@ pub fn run(path: String, anchor: Option<String>, format: String, compact: bool)
     match format.as_str() {
         "json" => {
             let json = if compact {
-                let mut compact_out = serde_json::json!({
-                    "contracts": output.contracts,
-                    "dependencies": output.dependencies,
-                    "decisions": output.decisions,
-                    "recent_history": output.recent_history,
-                    "open_follow_ups": output.open_follow_ups,
-                    "staleness": output.staleness,
-                });
-                if let Some(ref k) = output.knowledge {
-                    compact_out["knowledge"] = serde_json::to_value(k).unwrap_or_default();
-                }
-                serde_json::to_string_pretty(&compact_out)
+                serde_json::to_string_pretty(&CompactLookup {
+                    contracts: &output.contracts,
+                    decisions: &output.decisions,
+                    dependencies: &output.dependencies,
+                    knowledge: output.knowledge.as_ref(),
+                    open_follow_ups: &output.open_follow_ups,
+                    recent_history: &output.recent_history,
+                    staleness: &output.staleness,
+                })
             } else {
                 serde_json::to_string_pretty(&output)
             }
@@ -42,119 +67,134 @@ pub fn run(path: String, anchor: Option<String>, format: String, compact: bool)
             println!("{json}");
         }
         _ => {
-            println!("Lookup for: {}", output.file);
-            println!();
-
-            if !output.contracts.is_empty() {
-                println!("Contracts:");
-                for c in &output.contracts {
-                    let anchor_str = c
-                        .anchor
-                        .as_ref()
-                        .map(|a| format!(":{}", a))
-                        .unwrap_or_default();
-                    println!(
-                        "  [{}] {}{}: {}",
-                        c.source, c.file, anchor_str, c.description
-                    );
-                }
-                println!();
-            }
+            let stdout = std::io::stdout();
+            let mut w = BufWriter::new(stdout.lock());
+            print_pretty(&output, &mut w)
+                .and_then(|()| w.flush())
+                .map_err(|e| crate::error::ChronicleError::Io {
+                    source: e,
+                    location: snafu::Location::default(),
+                })?;
+        }
+    }
 
-            if !output.dependencies.is_empty() {
-                println!("Dependencies:");
-                for d in &output.dependencies {
-                    let anchor_str = d
-                        .anchor
-                        .as_ref()
-                        .map(|a| format!(":{}", a))
-                        .unwrap_or_default();
-                    println!(
-                        "  {}{} -> {}:{} ({})",
-                        d.file, anchor_str, d.target_file, d.target_anchor, d.assumption
-                    );
-                }
-                println!();
-            }
+    Ok(())
+}
 
-            if !output.decisions.is_empty() {
-                println!("Decisions:");
-                for d in &output.decisions {
-                    println!("  [{}] {}: {}", d.stability, d.what, d.why);
-                }
-                println!();
-            }
+/// Render the lookup as human-readable text. Callers pass a buffered writer
+/// so the whole report goes out in a few writes rather than one per line.
+fn print_pretty(output: &LookupOutput, w: &mut dyn Write) -> std::io::Result<()> {
+    writeln!(w, "Lookup for: {}", output.file)?;
+    writeln!(w)?;
 
-            if !output.recent_history.is_empty() {
-                println!("Recent history:");
-                for h in &output.recent_history {
-                    println!(
-                        "  {} {}: {}",
-                        &h.commit[..7.min(h.commit.len())],
-                        h.timestamp,
-                        h.intent
-                    );
-                }
-                println!();
-            }
+    if !output.contracts.is_empty() {
+        writeln!(w, "Contracts:")?;
+        for c in &output.contracts {
+            let (sep, anchor) = anchor_suffix(c.anchor.as_deref());
+            writeln!(
+                w,
+                "  [{}] {}{}{}: {}",
+                c.source, c.file, sep, anchor, c.description
+            )?;
+        }
+        writeln!(w)?;
+    }
 
-            if !output.open_follow_ups.is_empty() {
-                println!("Open follow-ups:");
-                for f in &output.open_follow_ups {
-                    println!("  {} {}", &f.commit[..7.min(f.commit.len())], f.follow_up);
-                }
-                println!();
-            }
+    if !output.dependencies.is_empty() {
+        writeln!(w, "Dependencies:")?;
+        for d in &output.dependencies {
+            let (sep, anchor) = anchor_suffix(d.anchor.as_deref());
+            writeln!(
+                w,
+                "  {}{}{} -> {}:{} ({})",
+                d.file, sep, anchor, d.target_file, d.target_anchor, d.assumption
+            )?;
+        }
+        writeln!(w)?;
+    }
 
-            if let Some(ref knowledge) = output.knowledge {
-                if !knowledge.conventions.is_empty() {
-                    println!("Applicable conventions:");
-                    for c in &knowledge.conventions {
-                        println!("  [{}] {}", c.id, c.rule);
-                    }
-                    println!();
-                }
-                if !knowledge.boundaries.is_empty() {
-                    println!("Module boundaries:");
-                    for b in &knowledge.boundaries {
-                        println!("  [{}] {}: {}", b.id, b.owns, b.boundary);
-                    }
-                    println!();
-                }
-                if !knowledge.anti_patterns.is_empty() {
-                    println!("Anti-patterns:");
-                    for a in &knowledge.anti_patterns {
-                        println!("  [{}] Don't: {} -> {}", a.id, a.pattern, a.instead);
-                    }
-                    println!();
-                }
-            }
+    if !output.decisions.is_empty() {
+        writeln!(w, "Decisions:")?;
+        for d in &output.decisions {
+            writeln!(w, "  [{}] {}: {}", d.stability, d.what, d.why)?;
+        }
+        writeln!(w)?;
+    }
 
-            if !output.staleness.is_empty() {
-                let stale_entries: Vec<_> = output.staleness.iter().filter(|s| s.stale).collect();
-                if !stale_entries.is_empty() {
-                    println!("Stale annotations:");
-                    for s in &stale_entries {
-                        println!(
-                            "  {} ({} commits behind)",
-                            &s.annotation_commit[..7.min(s.annotation_commit.len())],
-                            s.commits_since
-                        );
-                    }
-                    println!();
-                }
-            }
+    if !output.recent_history.is_empty() {
+        writeln!(w, "Recent history:")?;
+        for h in &output.recent_history {
+            writeln!(
+                w,
+                "  {} {}: {}",
+                &h.commit[..7.min(h.commit.len())],
+                h.timestamp,
+                h.intent
+            )?;
+        }
+        writeln!(w)?;
+    }
 
-            if output.contracts.is_empty()
-                && output.dependencies.is_empty()
-                && output.decisions.is_empty()
-                && output.recent_history.is_empty()
-                && output.open_follow_ups.is_empty()
-                && output.staleness.is_empty()
-            {
-                println!("  (no context found)");
+    if !output.open_follow_ups.is_empty() {
+        writeln!(w, "Open follow-ups:")?;
+        for f in &output.open_follow_ups {
+            writeln!(
+                w,
+                "  {} {}",
+                &f.commit[..7.min(f.commit.len())],
+                f.follow_up
+            )?;
+        }
+        writeln!(w)?;
+    }
+
+    if let Some(ref knowledge) = output.knowledge {
+        if !knowledge.conventions.is_empty() {
+            writeln!(w, "Applicable conventions:")?;
+            for c in &knowledge.conventions {
+                writeln!(w, "  [{}] {}", c.id, c.rule)?;
             }
+            writeln!(w)?;
         }
+        if !knowledge.boundaries.is_empty() {
+            writeln!(w, "Module boundaries:")?;
+            for b in &knowledge.boundaries {
+                writeln!(w, "  [{}] {}: {}", b.id, b.owns, b.boundary)?;
+            }
+            writeln!(w)?;
+        }
+        if !knowledge.anti_patterns.is_empty() {
+            writeln!(w, "Anti-patterns:")?;
+            for a in &knowledge.anti_patterns {
+                writeln!(w, "  [{}] Don't: {} -> {}", a.id, a.pattern, a.instead)?;
+            }
+            writeln!(w)?;
+        }
+    }
+
+    // Single pass over staleness: only print the header if a stale entry exists.
+    let mut stale_entries = output.staleness.iter().filter(|s| s.stale).peekable();
+    if stale_entries.peek().is_some() {
+        writeln!(w, "Stale annotations:")?;
+        for s in stale_entries {
+            writeln!(
+                w,
+                "  {} ({} commits behind)",
+                &s.annotation_commit[..7.min(s.annotation_commit.len())],
+                s.commits_since
+            )?;
+        }
+        writeln!(w)?;
+    }
+
+    if output.contracts.is_empty()
+        && output.dependencies.is_empty()
+        && output.decisions.is_empty()
+        && output.recent_history.is_empty()
+        && output.open_follow_ups.is_empty()
+        && output.staleness.is_empty()
+    {
+        writeln!(w, "  (no context found)")?;
     }
 
     Ok(())
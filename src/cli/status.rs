@@ -94,6 +94,7 @@ fn get_recent_commits_dyn(git_ops: &dyn GitOps, count: usize) -> Result<Vec<Stri
     let output = std::process::Command::new("git")
         .args(["log", "--format=%H", &format!("-{count}")])
         .current_dir(&repo_dir)
+        .stderr(std::process::Stdio::null())
         .output()
         .map_err(|e| crate::error::ChronicleError::Io {
             source: e,
@@ -1,6 +1,12 @@
 use crate::error::Result;
 use crate::git::CliOps;
-use crate::read::summary::{build_summary, SummaryQuery};
+use crate::read::summary::{build_summary, SummaryQuery, SummaryUnit};
+
+/// `--compact` output: only the summary units.
+#[derive(serde::Serialize)]
+struct CompactSummary<'a> {
+    units: &'a [SummaryUnit],
+}
 
 pub fn run(path: String, anchor: Option<String>, format: String, compact: bool) -> Result<()> {
     let repo_dir = std::env::current_dir().map_err(|e| crate::error::ChronicleError::Io {
@@ -18,10 +24,9 @@ pub fn run(path: String, anchor: Option<String>, format: String, compact: bool)
         })?;
 
     let json = if compact {
-        let compact_out = serde_json::json!({
-            "units": result.units,
-        });
-        serde_json::to_string_pretty(&compact_out)
+        serde_json::to_string_pretty(&CompactSummary {
+            units: &result.units,
+        })
     } else if format == "pretty" {
         serde_json::to_string_pretty(&result)
     } else {
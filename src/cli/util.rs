@@ -8,6 +8,7 @@ use snafu::ResultExt;
 pub(crate) fn find_git_dir() -> Result<PathBuf> {
     let output = std::process::Command::new("git")
         .args(["rev-parse", "--git-dir"])
+        .stderr(std::process::Stdio::null())
         .output()
         .context(IoSnafu)?;
 
@@ -25,3 +26,12 @@ pub(crate) fn find_git_dir() -> Result<PathBuf> {
         Err(NotARepositorySnafu { path: cwd }.build())
     }
 }
+
+/// Split an optional anchor into a `(":", name)` pair for pretty output, so
+/// rows can be formatted in one `println!` without allocating a suffix string.
+pub(crate) fn anchor_suffix(anchor: Option<&str>) -> (&'static str, &str) {
+    match anchor {
+        Some(a) => (":", a),
+        None => ("", ""),
+    }
+}
@@ -33,52 +33,48 @@ impl Default for ChronicleConfig {
     }
 }
 
+/// Git config keys read by `load_config`.
+const CONFIG_KEYS: [&str; 8] = [
+    "chronicle.enabled",
+    "chronicle.sync",
+    "chronicle.provider",
+    "chronicle.model",
+    "chronicle.noteref",
+    "chronicle.maxdifflines",
+    "chronicle.skiptrivial",
+    "chronicle.trivialthreshold",
+];
+
 /// Load config from git config, merging with defaults.
+///
+/// All keys are fetched in one `config_get_many` call rather than one git
+/// process per key.
 pub fn load_config(git_ops: &dyn GitOps) -> Result<ChronicleConfig> {
     let mut config = ChronicleConfig::default();
+    let values = git_ops.config_get_many(&CONFIG_KEYS).context(GitSnafu)?;
 
-    if let Some(val) = git_ops.config_get("chronicle.enabled").context(GitSnafu)? {
-        config.enabled = val == "true" || val == "1";
-    }
-
-    if let Some(val) = git_ops.config_get("chronicle.sync").context(GitSnafu)? {
-        config.sync = val == "true" || val == "1";
-    }
-
-    if let Some(val) = git_ops.config_get("chronicle.provider").context(GitSnafu)? {
-        config.provider = Some(val);
-    }
-
-    if let Some(val) = git_ops.config_get("chronicle.model").context(GitSnafu)? {
-        config.model = Some(val);
-    }
-
-    if let Some(val) = git_ops.config_get("chronicle.noteref").context(GitSnafu)? {
-        config.notes_ref = val;
-    }
-
-    if let Some(val) = git_ops
-        .config_get("chronicle.maxdifflines")
-        .context(GitSnafu)?
-    {
-        if let Ok(n) = val.parse::<u32>() {
-            config.max_diff_lines = n;
-        }
-    }
-
-    if let Some(val) = git_ops
-        .config_get("chronicle.skiptrivial")
-        .context(GitSnafu)?
-    {
-        config.skip_trivial = val == "true" || val == "1";
-    }
-
-    if let Some(val) = git_ops
-        .config_get("chronicle.trivialthreshold")
-        .context(GitSnafu)?
-    {
-        if let Ok(n) = val.parse::<u32>() {
-            config.trivial_threshold = n;
+    for (&key, val) in CONFIG_KEYS.iter().zip(values) {
+        let Some(val) = val else {
+            continue;
+        };
+        match key {
+            "chronicle.enabled" => config.enabled = val == "true" || val == "1",
+            "chronicle.sync" => config.sync = val == "true" || val == "1",
+            "chronicle.provider" => config.provider = Some(val),
+            "chronicle.model" => config.model = Some(val),
+            "chronicle.noteref" => config.notes_ref = val,
+            "chronicle.maxdifflines" => {
+                if let Ok(n) = val.parse::<u32>() {
+                    config.max_diff_lines = n;
+                }
+            }
+            "chronicle.skiptrivial" => config.skip_trivial = val == "true" || val == "1",
+            "chronicle.trivialthreshold" => {
+                if let Ok(n) = val.parse::<u32>() {
+                    config.trivial_threshold = n;
+                }
+            }
+            _ => {}
         }
     }
 
@@ -5,8 +5,8 @@ use serde::{Deserialize, Serialize};
 use crate::error::Result;
 use crate::git::GitOps;
 
-/// Status of a single doctor check.
-#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+/// Status of a single doctor check, ordered from best to worst.
+#[derive(Debug, Clone, PartialEq, Eq, PartialOrd, Ord, Serialize, Deserialize)]
 #[serde(rename_all = "snake_case")]
 pub enum DoctorStatus {
     Pass,
@@ -48,13 +48,12 @@ pub fn run_doctor(git_ops: &dyn GitOps, git_dir: &Path) -> Result<DoctorReport>
     ];
     checks.extend(check_global_setup());
 
-    let overall = if checks.iter().any(|c| c.status == DoctorStatus::Fail) {
-        DoctorStatus::Fail
-    } else if checks.iter().any(|c| c.status == DoctorStatus::Warn) {
-        DoctorStatus::Warn
-    } else {
-        DoctorStatus::Pass
-    };
+    let overall = checks
+        .iter()
+        .map(|c| &c.status)
+        .max()
+        .cloned()
+        .unwrap_or(DoctorStatus::Pass);
 
     Ok(DoctorReport {
         version: env!("CARGO_PKG_VERSION").to_string(),
@@ -21,12 +21,16 @@ pub struct ExportEntry {
 ///
 /// Iterates all notes under `refs/notes/chronicle`, and writes one JSON object
 /// per line. Preserves the raw annotation format (v1 or v2).
+///
+/// Callers should pass a buffered writer; records are never flushed
+/// individually, only once after the last line is written.
 pub fn export_annotations<W: Write>(git_ops: &dyn GitOps, writer: &mut W) -> Result<usize> {
     let note_list = git_ops.list_annotated_commits(u32::MAX).context(GitSnafu)?;
+    let notes = git_ops.note_read_batch(&note_list).context(GitSnafu)?;
     let mut count = 0;
 
-    for sha in &note_list {
-        let note_content = match git_ops.note_read(sha).context(GitSnafu)? {
+    for (sha, note) in note_list.into_iter().zip(notes) {
+        let note_content = match note {
             Some(content) => content,
             None => continue,
         };
@@ -43,24 +47,35 @@ pub fn export_annotations<W: Write>(git_ops: &dyn GitOps, writer: &mut W) -> Res
             .to_string();
 
         let entry = ExportEntry {
-            commit_sha: sha.clone(),
+            commit_sha: sha,
             timestamp,
             annotation,
         };
 
-        let line =
-            serde_json::to_string(&entry).map_err(|e| crate::error::ChronicleError::Json {
+        // Serialize straight into the writer rather than via an intermediate String.
+        serde_json::to_writer(&mut *writer, &entry).map_err(|e| {
+            crate::error::ChronicleError::Json {
+                source: e,
+                location: snafu::Location::default(),
+            }
+        })?;
+
+        writer
+            .write_all(b"\n")
+            .map_err(|e| crate::error::ChronicleError::Io {
                 source: e,
                 location: snafu::Location::default(),
             })?;
 
-        writeln!(writer, "{line}").map_err(|e| crate::error::ChronicleError::Io {
+        count += 1;
+    }
+
+    writer
+        .flush()
+        .map_err(|e| crate::error::ChronicleError::Io {
             source: e,
             location: snafu::Location::default(),
         })?;
 
-        count += 1;
-    }
-
     Ok(count)
 }
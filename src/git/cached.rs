@@ -0,0 +1,260 @@
+use std::collections::HashMap;
+use std::path::Path;
+use std::sync::Mutex;
+
+use crate::error::GitError;
+use crate::git::{CommitInfo, FileDiff, GitOps};
+
+/// Read-through memoizing wrapper around another `GitOps`.
+///
+/// Composite queries (e.g. `lookup`) run several read pipelines over the
+/// same file, each of which calls `log_for_file` and then `note_read` for
+/// every commit. Wrapping the backend for the duration of one query turns
+/// the repeats into map lookups instead of git subprocesses.
+///
+/// Ref resolutions and commit metadata are memoized too, so a caller that
+/// resolves a ref and then hands the same backend to a handler which
+/// resolves it again pays for one `rev-parse` and one `git log`.
+///
+/// Only successful results are cached. Writes go straight through and drop
+/// the cached note for that commit so later reads see the new content.
+pub struct CachedGitOps<'a> {
+    inner: &'a dyn GitOps,
+    notes: Mutex<HashMap<String, Option<String>>>,
+    file_logs: Mutex<HashMap<String, Vec<String>>>,
+    refs: Mutex<HashMap<String, String>>,
+    commits: Mutex<HashMap<String, CommitInfo>>,
+}
+
+impl<'a> CachedGitOps<'a> {
+    pub fn new(inner: &'a dyn GitOps) -> Self {
+        Self {
+            inner,
+            notes: Mutex::new(HashMap::new()),
+            file_logs: Mutex::new(HashMap::new()),
+            refs: Mutex::new(HashMap::new()),
+            commits: Mutex::new(HashMap::new()),
+        }
+    }
+}
+
+impl GitOps for CachedGitOps<'_> {
+    fn diff(&self, commit: &str) -> Result<Vec<FileDiff>, GitError> {
+        self.inner.diff(commit)
+    }
+
+    fn changed_files(&self, commit: &str) -> Result<Vec<String>, GitError> {
+        self.inner.changed_files(commit)
+    }
+
+    fn note_read(&self, commit: &str) -> Result<Option<String>, GitError> {
+        if let Some(hit) = self.notes.lock().unwrap().get(commit) {
+            return Ok(hit.clone());
+        }
+        let note = self.inner.note_read(commit)?;
+        self.notes
+            .lock()
+            .unwrap()
+            .insert(commit.to_string(), note.clone());
+        Ok(note)
+    }
+
+    fn note_read_batch(&self, commits: &[String]) -> Result<Vec<Option<String>>, GitError> {
+        let misses: Vec<String> = {
+            let notes = self.notes.lock().unwrap();
+            commits
+                .iter()
+                .filter(|c| !notes.contains_key(c.as_str()))
+                .cloned()
+                .collect()
+        };
+        if !misses.is_empty() {
+            let fetched = self.inner.note_read_batch(&misses)?;
+            let mut notes = self.notes.lock().unwrap();
+            for (commit, note) in misses.into_iter().zip(fetched) {
+                notes.insert(commit, note);
+            }
+        }
+        let notes = self.notes.lock().unwrap();
+        Ok(commits
+            .iter()
+            .map(|c| notes.get(c.as_str()).cloned().flatten())
+            .collect())
+    }
+
+    fn note_write(&self, commit: &str, content: &str) -> Result<(), GitError> {
+        self.notes.lock().unwrap().remove(commit);
+        self.inner.note_write(commit, content)
+    }
+
+    fn note_exists(&self, commit: &str) -> Result<bool, GitError> {
+        if let Some(hit) = self.notes.lock().unwrap().get(commit) {
+            return Ok(hit.is_some());
+        }
+        self.inner.note_exists(commit)
+    }
+
+    fn file_at_commit(&self, path: &Path, commit: &str) -> Result<String, GitError> {
+        self.inner.file_at_commit(path, commit)
+    }
+
+    fn commit_info(&self, commit: &str) -> Result<CommitInfo, GitError> {
+        if let Some(hit) = self.commits.lock().unwrap().get(commit) {
+            return Ok(hit.clone());
+        }
+        let info = self.inner.commit_info(commit)?;
+        self.commits
+            .lock()
+            .unwrap()
+            .insert(commit.to_string(), info.clone());
+        Ok(info)
+    }
+
+    fn resolve_ref(&self, refspec: &str) -> Result<String, GitError> {
+        if let Some(hit) = self.refs.lock().unwrap().get(refspec) {
+            return Ok(hit.clone());
+        }
+        let sha = self.inner.resolve_ref(refspec)?;
+        self.refs
+            .lock()
+            .unwrap()
+            .insert(refspec.to_string(), sha.clone());
+        Ok(sha)
+    }
+
+    fn config_get(&self, key: &str) -> Result<Option<String>, GitError> {
+        self.inner.config_get(key)
+    }
+
+    fn config_get_many(&self, keys: &[&str]) -> Result<Vec<Option<String>>, GitError> {
+        self.inner.config_get_many(keys)
+    }
+
+    fn config_set(&self, key: &str, value: &str) -> Result<(), GitError> {
+        self.inner.config_set(key, value)
+    }
+
+    fn log_for_file(&self, path: &str) -> Result<Vec<String>, GitError> {
+        if let Some(hit) = self.file_logs.lock().unwrap().get(path) {
+            return Ok(hit.clone());
+        }
+        let shas = self.inner.log_for_file(path)?;
+        self.file_logs
+            .lock()
+            .unwrap()
+            .insert(path.to_string(), shas.clone());
+        Ok(shas)
+    }
+
+    fn list_annotated_commits(&self, limit: u32) -> Result<Vec<String>, GitError> {
+        self.inner.list_annotated_commits(limit)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    #[derive(Default)]
+    struct CountingGitOps {
+        note_reads: AtomicUsize,
+        log_reads: AtomicUsize,
+        ref_reads: AtomicUsize,
+        info_reads: AtomicUsize,
+    }
+
+    impl GitOps for CountingGitOps {
+        fn diff(&self, _commit: &str) -> Result<Vec<FileDiff>, GitError> {
+            Ok(vec![])
+        }
+        fn note_read(&self, commit: &str) -> Result<Option<String>, GitError> {
+            self.note_reads.fetch_add(1, Ordering::SeqCst);
+            Ok(if commit == "abc" {
+                Some("note".to_string())
+            } else {
+                None
+            })
+        }
+        fn note_write(&self, _commit: &str, _content: &str) -> Result<(), GitError> {
+            Ok(())
+        }
+        fn note_exists(&self, _commit: &str) -> Result<bool, GitError> {
+            Ok(false)
+        }
+        fn file_at_commit(&self, _path: &Path, _commit: &str) -> Result<String, GitError> {
+            Ok(String::new())
+        }
+        fn commit_info(&self, commit: &str) -> Result<CommitInfo, GitError> {
+            self.info_reads.fetch_add(1, Ordering::SeqCst);
+            Ok(CommitInfo {
+                sha: commit.to_string(),
+                message: "test".to_string(),
+                author_name: "test".to_string(),
+                author_email: "test@test.com".to_string(),
+                timestamp: "2025-01-01T00:00:00Z".to_string(),
+                parent_shas: vec![],
+            })
+        }
+        fn resolve_ref(&self, _refspec: &str) -> Result<String, GitError> {
+            self.ref_reads.fetch_add(1, Ordering::SeqCst);
+            Ok("abc".to_string())
+        }
+        fn config_get(&self, _key: &str) -> Result<Option<String>, GitError> {
+            Ok(None)
+        }
+        fn config_set(&self, _key: &str, _value: &str) -> Result<(), GitError> {
+            Ok(())
+        }
+        fn log_for_file(&self, _path: &str) -> Result<Vec<String>, GitError> {
+            self.log_reads.fetch_add(1, Ordering::SeqCst);
+            Ok(vec!["abc".to_string(), "def".to_string()])
+        }
+        fn list_annotated_commits(&self, _limit: u32) -> Result<Vec<String>, GitError> {
+            Ok(vec![])
+        }
+    }
+
+    #[test]
+    fn test_repeated_reads_hit_inner_once() {
+        let inner = CountingGitOps::default();
+        let cached = CachedGitOps::new(&inner);
+
+        for _ in 0..3 {
+            assert_eq!(cached.log_for_file("src/main.rs").unwrap().len(), 2);
+            assert_eq!(cached.note_read("abc").unwrap().as_deref(), Some("note"));
+            assert_eq!(cached.note_read("def").unwrap(), None);
+        }
+        assert!(cached.note_exists("abc").unwrap());
+        assert!(!cached.note_exists("def").unwrap());
+
+        assert_eq!(inner.log_reads.load(Ordering::SeqCst), 1);
+        assert_eq!(inner.note_reads.load(Ordering::SeqCst), 2);
+    }
+
+    #[test]
+    fn test_note_write_invalidates_cached_note() {
+        let inner = CountingGitOps::default();
+        let cached = CachedGitOps::new(&inner);
+
+        cached.note_read("abc").unwrap();
+        cached.note_write("abc", "updated").unwrap();
+        cached.note_read("abc").unwrap();
+
+        assert_eq!(inner.note_reads.load(Ordering::SeqCst), 2);
+    }
+
+    #[test]
+    fn test_resolve_and_commit_info_hit_inner_once() {
+        let inner = CountingGitOps::default();
+        let cached = CachedGitOps::new(&inner);
+
+        for _ in 0..2 {
+            let sha = cached.resolve_ref("HEAD").unwrap();
+            assert_eq!(cached.commit_info(&sha).unwrap().sha, "abc");
+        }
+
+        assert_eq!(inner.ref_reads.load(Ordering::SeqCst), 1);
+        assert_eq!(inner.info_reads.load(Ordering::SeqCst), 1);
+    }
+}
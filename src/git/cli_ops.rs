@@ -1,10 +1,12 @@
+use std::collections::HashMap;
+use std::io::Write;
 use std::path::{Path, PathBuf};
-use std::process::Command;
+use std::process::{Command, Stdio};
 
 use crate::error::git_error::{CommandFailedSnafu, CommitNotFoundSnafu, FileNotFoundSnafu};
 use crate::error::GitError;
 use crate::git::diff::parse_diff;
-use crate::git::{CommitInfo, FileDiff, GitOps};
+use crate::git::{into_string, is_full_sha, CommitInfo, FileDiff, GitOps};
 
 /// Git operations implemented by shelling out to the `git` CLI.
 pub struct CliOps {
@@ -27,19 +29,45 @@ impl CliOps {
 
     /// Run a git command and return stdout on success, or an error with stderr.
     fn run_git(&self, args: &[&str]) -> Result<String, GitError> {
-        let output = Command::new("git")
+        let (success, stdout, stderr) = self.run_git_raw(args)?;
+        if success {
+            Ok(stdout)
+        } else {
+            Err(CommandFailedSnafu {
+                message: stderr.trim().to_string(),
+            }
+            .build())
+        }
+    }
+
+    /// Run a git command with `input` on stdin; returns stdout on success, or
+    /// an error with stderr.
+    fn run_git_with_stdin(&self, args: &[&str], input: &str) -> Result<String, GitError> {
+        let io_err = |e: std::io::Error| {
+            CommandFailedSnafu {
+                message: format!("failed to run git: {e}"),
+            }
+            .build()
+        };
+
+        let mut child = Command::new("git")
             .args(args)
             .current_dir(&self.repo_dir)
-            .output()
-            .map_err(|e| {
-                CommandFailedSnafu {
-                    message: format!("failed to run git: {e}"),
-                }
-                .build()
-            })?;
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::piped())
+            .spawn()
+            .map_err(io_err)?;
+
+        // Dropping stdin after the write closes it so git sees EOF.
+        let mut stdin = child.stdin.take().expect("stdin is piped");
+        let write_result = stdin.write_all(input.as_bytes());
+        drop(stdin);
+        let output = child.wait_with_output().map_err(io_err)?;
 
         if output.status.success() {
-            Ok(String::from_utf8_lossy(&output.stdout).to_string())
+            write_result.map_err(io_err)?;
+            Ok(into_string(output.stdout))
         } else {
             let stderr = String::from_utf8_lossy(&output.stderr).to_string();
             Err(CommandFailedSnafu {
@@ -62,26 +90,87 @@ impl CliOps {
                 .build()
             })?;
 
-        let stdout = String::from_utf8_lossy(&output.stdout).to_string();
-        let stderr = String::from_utf8_lossy(&output.stderr).to_string();
+        let stdout = into_string(output.stdout);
+        let stderr = into_string(output.stderr);
         Ok((output.status.success(), stdout, stderr))
     }
+
+    /// Run `git diff-tree` for a single commit with the given output flags,
+    /// mapping an unknown commit to `CommitNotFound`.
+    fn diff_tree(&self, flags: &[&str], commit: &str) -> Result<String, GitError> {
+        // --root only changes the output for root commits (diffed against the
+        // empty tree), so pass it unconditionally instead of spending a
+        // `git log` call to check for parents first.
+        let mut args = vec!["diff-tree", "--root", "-M"];
+        args.extend_from_slice(flags);
+        args.push(commit);
+        let (success, stdout, stderr) = self.run_git_raw(&args)?;
+        if success {
+            return Ok(stdout);
+        }
+        if stderr.contains("unknown revision") || stderr.contains("bad object") {
+            return Err(CommitNotFoundSnafu {
+                sha: commit.to_string(),
+            }
+            .build());
+        }
+        Err(CommandFailedSnafu {
+            message: stderr.trim().to_string(),
+        }
+        .build())
+    }
+
+    /// Run git for its exit status only; stdout and stderr go to /dev/null
+    /// instead of being captured and thrown away.
+    fn run_git_status(&self, args: &[&str]) -> Result<bool, GitError> {
+        let status = Command::new("git")
+            .args(args)
+            .current_dir(&self.repo_dir)
+            .stdout(Stdio::null())
+            .stderr(Stdio::null())
+            .status()
+            .map_err(|e| {
+                CommandFailedSnafu {
+                    message: format!("failed to run git: {e}"),
+                }
+                .build()
+            })?;
+        Ok(status.success())
+    }
+}
+
+/// Canonical form of a config key as git prints it: section and variable
+/// name lowercased, subsection (if any) kept as-is.
+fn canonical_config_key(key: &str) -> String {
+    match (key.find('.'), key.rfind('.')) {
+        (Some(first), Some(last)) => format!(
+            "{}{}{}",
+            key[..first].to_ascii_lowercase(),
+            &key[first..last],
+            key[last..].to_ascii_lowercase()
+        ),
+        _ => key.to_ascii_lowercase(),
+    }
 }
 
 impl GitOps for CliOps {
     fn diff(&self, commit: &str) -> Result<Vec<FileDiff>, GitError> {
-        // Check if this is a root commit (no parents)
-        let info = self.commit_info(commit)?;
-        let diff_output = if info.parent_shas.is_empty() {
-            // Root commit: use --root flag
-            self.run_git(&["diff-tree", "--root", "-p", "--no-color", "-M", commit])?
-        } else {
-            self.run_git(&["diff-tree", "-p", "--no-color", "-M", commit])?
-        };
-
+        let diff_output = self.diff_tree(&["-p", "--no-color"], commit)?;
         parse_diff(&diff_output)
     }
 
+    fn changed_files(&self, commit: &str) -> Result<Vec<String>, GitError> {
+        // Only the file headers are needed, so have git list the paths
+        // (NUL-terminated, unquoted) instead of producing and parsing every
+        // hunk of the patch.
+        let output = self.diff_tree(&["--no-commit-id", "--name-only", "-r", "-z"], commit)?;
+        Ok(output
+            .split('\0')
+            .filter(|p| !p.is_empty())
+            .map(|p| p.to_string())
+            .collect())
+    }
+
     fn note_read(&self, commit: &str) -> Result<Option<String>, GitError> {
         let (success, stdout, _stderr) =
             self.run_git_raw(&["notes", "--ref", &self.notes_ref, "show", commit])?;
@@ -93,49 +182,90 @@ impl GitOps for CliOps {
         }
     }
 
-    fn note_write(&self, commit: &str, content: &str) -> Result<(), GitError> {
-        // Use a tempfile to avoid shell escaping issues with note content
-        let tmp_dir = self.repo_dir.join(".git").join("chronicle");
-        std::fs::create_dir_all(&tmp_dir).map_err(|e| {
-            CommandFailedSnafu {
-                message: format!("failed to create temp dir: {e}"),
-            }
-            .build()
-        })?;
+    fn note_read_batch(&self, commits: &[String]) -> Result<Vec<Option<String>>, GitError> {
+        if commits.is_empty() {
+            return Ok(Vec::new());
+        }
 
-        let tmp_path = tmp_dir.join("note-tmp.json");
-        std::fs::write(&tmp_path, content).map_err(|e| {
-            CommandFailedSnafu {
-                message: format!("failed to write temp file: {e}"),
+        // One `git log --no-walk` over just the requested commits prints each
+        // one's note next to its sha, so the cost follows the size of the
+        // request rather than the number of notes in the repository.
+        // `--no-notes` first drops any `notes.displayRef` refs so only the
+        // chronicle note is shown, and `--no-show-signature` keeps a user's
+        // `log.showSignature` from running gpg per commit and printing its
+        // output ahead of each record. Git reads all of stdin before it
+        // starts writing, so the input can be written in one go.
+        let mut input = String::with_capacity(commits.len() * 41);
+        for commit in commits.iter().filter(|c| is_full_sha(c)) {
+            input.push_str(commit);
+            input.push('\n');
+        }
+        let mut notes: HashMap<String, String> = HashMap::new();
+        if !input.is_empty() {
+            let notes_arg = format!("--notes={}", self.notes_ref);
+            let stdout = match self.run_git_with_stdin(
+                &[
+                    "log",
+                    "--no-walk=unsorted",
+                    "--stdin",
+                    "--no-show-signature",
+                    "--no-notes",
+                    &notes_arg,
+                    "--format=%H%x00%N%x00",
+                ],
+                &input,
+            ) {
+                Ok(stdout) => stdout,
+                // One unknown commit fails the whole listing; fall back to
+                // reading the notes one at a time.
+                Err(_) => return commits.iter().map(|c| self.note_read(c)).collect(),
+            };
+            let mut fields = stdout.split('\0');
+            while let (Some(sha), Some(note)) = (fields.next(), fields.next()) {
+                // Git refuses to store empty notes, so empty means "no note".
+                if !note.is_empty() {
+                    notes.insert(sha.trim_start().to_string(), note.to_string());
+                }
             }
-            .build()
-        })?;
-
-        let tmp_path_str = tmp_path.to_string_lossy();
-
-        // Try add first, if that fails (note exists), use add --force
-        let result = self.run_git(&[
-            "notes",
-            "--ref",
-            &self.notes_ref,
-            "add",
-            "-f",
-            "-F",
-            &tmp_path_str,
-            commit,
-        ]);
-
-        // Clean up temp file regardless of result
-        let _ = std::fs::remove_file(&tmp_path);
-
-        result?;
+        }
+
+        commits
+            .iter()
+            .map(|c| {
+                if is_full_sha(c) {
+                    Ok(notes.get(c.as_str()).cloned())
+                } else {
+                    // Abbreviated sha or ref: let git resolve it.
+                    self.note_read(c)
+                }
+            })
+            .collect()
+    }
+
+    fn note_write(&self, commit: &str, content: &str) -> Result<(), GitError> {
+        // Pipe the content to `-F -` rather than passing it as an argument
+        // (no shell escaping) or staging it in a tempfile (no per-note
+        // mkdir/write/unlink). `-f` overwrites an existing note.
+        self.run_git_with_stdin(
+            &[
+                "notes",
+                "--ref",
+                &self.notes_ref,
+                "add",
+                "-f",
+                "-F",
+                "-",
+                commit,
+            ],
+            content,
+        )?;
         Ok(())
     }
 
     fn note_exists(&self, commit: &str) -> Result<bool, GitError> {
-        let (success, _stdout, _stderr) =
-            self.run_git_raw(&["notes", "--ref", &self.notes_ref, "show", commit])?;
-        Ok(success)
+        // `notes list <commit>` prints only the note's blob id, so the note
+        // content is never read.
+        self.run_git_status(&["notes", "--ref", &self.notes_ref, "list", commit])
     }
 
     fn file_at_commit(&self, path: &Path, commit: &str) -> Result<String, GitError> {
@@ -223,6 +353,42 @@ impl GitOps for CliOps {
         }
     }
 
+    fn config_get_many(&self, keys: &[&str]) -> Result<Vec<Option<String>>, GitError> {
+        let mut values = vec![None; keys.len()];
+        if keys.is_empty() {
+            return Ok(values);
+        }
+
+        // One `git config --get-regexp` for all keys instead of one process
+        // per key. The regexp is matched against canonical names, and keys
+        // are plain dotted names, so only `.` needs escaping.
+        let canonical: Vec<String> = keys.iter().map(|k| canonical_config_key(k)).collect();
+        let alternatives: Vec<String> = canonical.iter().map(|k| k.replace('.', "\\.")).collect();
+        let pattern = format!("^({})$", alternatives.join("|"));
+        let (success, stdout, _stderr) =
+            self.run_git_raw(&["config", "-z", "--get-regexp", &pattern])?;
+        if !success {
+            // Exit code 1 means none of the keys are set
+            return Ok(values);
+        }
+
+        // -z output: "name\nvalue\0" per entry ("name\0" for a bare key).
+        // A later entry overrides an earlier one, matching what
+        // `git config --get` returns.
+        for entry in stdout.split('\0') {
+            let (name, value) = entry.split_once('\n').unwrap_or((entry, ""));
+            if let Some(i) = canonical.iter().position(|k| k == name) {
+                let value = value.trim();
+                values[i] = if value.is_empty() {
+                    None
+                } else {
+                    Some(value.to_string())
+                };
+            }
+        }
+        Ok(values)
+    }
+
     fn config_set(&self, key: &str, value: &str) -> Result<(), GitError> {
         self.run_git(&["config", key, value])?;
         Ok(())
@@ -11,7 +11,7 @@ pub enum DiffStatus {
     Renamed,
 }
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq, Eq)]
 pub struct FileDiff {
     pub path: String,
     pub old_path: Option<String>,
@@ -19,7 +19,7 @@ pub struct FileDiff {
     pub hunks: Vec<Hunk>,
 }
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq, Eq)]
 pub struct Hunk {
     pub old_start: u32,
     pub old_count: u32,
@@ -29,7 +29,7 @@ pub struct Hunk {
     pub lines: Vec<HunkLine>,
 }
 
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, PartialEq, Eq)]
 pub enum HunkLine {
     Context(String),
     Added(String),
@@ -53,8 +53,13 @@ impl FileDiff {
             .count()
     }
 
+    /// Added plus removed lines, counted in a single pass over the hunks.
     pub fn changed_line_count(&self) -> usize {
-        self.added_line_count() + self.removed_line_count()
+        self.hunks
+            .iter()
+            .flat_map(|h| &h.lines)
+            .filter(|l| !matches!(l, HunkLine::Context(_)))
+            .count()
     }
 }
 
@@ -126,24 +131,21 @@ pub fn parse_diff(diff_output: &str) -> Result<Vec<FileDiff>, crate::error::GitE
                 let mut hunk_lines: Vec<HunkLine> = Vec::new();
                 i += 1;
 
-                while i < lines.len()
-                    && !lines[i].starts_with("@@")
-                    && !lines[i].starts_with("diff --git ")
-                {
+                while i < lines.len() {
                     let l = lines[i];
-                    if let Some(content) = l.strip_prefix('+') {
-                        hunk_lines.push(HunkLine::Added(content.to_string()));
-                    } else if let Some(content) = l.strip_prefix('-') {
-                        hunk_lines.push(HunkLine::Removed(content.to_string()));
-                    } else if let Some(content) = l.strip_prefix(' ') {
-                        hunk_lines.push(HunkLine::Context(content.to_string()));
-                    } else if l == "\\ No newline at end of file" {
-                        // skip
-                    } else if l.is_empty() {
+                    // Classify each body line with one match on its leading
+                    // byte; only '@' and 'd' need a full prefix check to spot
+                    // the start of the next hunk or file.
+                    match l.as_bytes().first() {
+                        Some(b'+') => hunk_lines.push(HunkLine::Added(l[1..].to_string())),
+                        Some(b'-') => hunk_lines.push(HunkLine::Removed(l[1..].to_string())),
+                        Some(b' ') => hunk_lines.push(HunkLine::Context(l[1..].to_string())),
+                        Some(b'@') if l.starts_with("@@") => break,
+                        Some(b'd') if l.starts_with("diff --git ") => break,
                         // empty context line (git sometimes omits the leading space)
-                        hunk_lines.push(HunkLine::Context(String::new()));
-                    } else {
-                        // unknown line, skip
+                        None => hunk_lines.push(HunkLine::Context(String::new())),
+                        // "\ No newline at end of file" and unknown lines are skipped
+                        Some(_) => {}
                     }
                     i += 1;
                 }
@@ -231,16 +233,19 @@ fn parse_hunk_header(line: &str) -> Result<(u32, u32, u32, u32), crate::error::G
         .build()
     })?;
     let range_part = &line[3..at_end]; // skip "@@ "
-    let parts: Vec<&str> = range_part.split(' ').collect();
-    if parts.len() < 2 {
+
+    // Only the first two fields matter; pull them straight off the iterator
+    // instead of collecting every field of every hunk header into a Vec.
+    let mut parts = range_part.split(' ');
+    let (Some(old_range), Some(new_range)) = (parts.next(), parts.next()) else {
         return Err(DiffParseSnafu {
             message: format!("invalid hunk header ranges: {line}"),
         }
         .build());
-    }
+    };
 
-    let (old_start, old_count) = parse_range(parts[0].trim_start_matches('-'))?;
-    let (new_start, new_count) = parse_range(parts[1].trim_start_matches('+'))?;
+    let (old_start, old_count) = parse_range(old_range.trim_start_matches('-'))?;
+    let (new_start, new_count) = parse_range(new_range.trim_start_matches('+'))?;
 
     Ok((old_start, old_count, new_start, new_count))
 }
@@ -271,3 +276,48 @@ fn parse_range(s: &str) -> Result<(u32, u32), crate::error::GitError> {
         Ok((start, 1))
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_diff_classifies_hunk_lines() {
+        let diff = "diff --git a/a.rs b/a.rs\n\
+                    index 1111111..2222222 100644\n\
+                    --- a/a.rs\n\
+                    +++ b/a.rs\n\
+                    @@ -1,2 +1,2 @@\n \
+                    keep\n\
+                    -old\n\
+                    +new\n\
+                    \\ No newline at end of file\n\
+                    @@ -10,0 +11,1 @@\n\
+                    +added\n\
+                    \n\
+                    diff --git a/b.rs b/b.rs\n\
+                    new file mode 100644\n\
+                    --- /dev/null\n\
+                    +++ b/b.rs\n\
+                    @@ -0,0 +1 @@\n\
+                    +fresh\n";
+
+        let files = parse_diff(diff).unwrap();
+        assert_eq!(files.len(), 2);
+
+        let a = &files[0];
+        assert_eq!(a.path, "a.rs");
+        assert_eq!(a.hunks.len(), 2);
+        assert_eq!(a.hunks[0].lines.len(), 3);
+        assert!(matches!(&a.hunks[0].lines[0], HunkLine::Context(s) if s == "keep"));
+        assert!(matches!(&a.hunks[0].lines[1], HunkLine::Removed(s) if s == "old"));
+        assert!(matches!(&a.hunks[0].lines[2], HunkLine::Added(s) if s == "new"));
+        assert_eq!(a.hunks[1].lines.len(), 2);
+        assert!(matches!(&a.hunks[1].lines[1], HunkLine::Context(s) if s.is_empty()));
+
+        let b = &files[1];
+        assert_eq!(b.path, "b.rs");
+        assert_eq!(b.status, DiffStatus::Added);
+        assert_eq!(b.added_line_count(), 1);
+    }
+}
@@ -1,12 +1,29 @@
+pub mod cached;
 pub mod cli_ops;
 pub mod diff;
 
+pub use cached::CachedGitOps;
 pub use cli_ops::CliOps;
 pub use diff::{DiffStatus, FileDiff, Hunk, HunkLine};
 
 use crate::error::GitError;
 use std::path::Path;
 
+/// Whether `s` is a full (SHA-1 or SHA-256) hex object name, as printed by
+/// `git notes list` and `git log --format=%H`.
+pub(crate) fn is_full_sha(s: &str) -> bool {
+    (s.len() == 40 || s.len() == 64) && s.bytes().all(|b| b.is_ascii_hexdigit())
+}
+
+/// Convert captured git output to a `String`, reusing the buffer when it is
+/// valid UTF-8 (the common case) and only copying to replace invalid bytes.
+pub(crate) fn into_string(bytes: Vec<u8>) -> String {
+    match String::from_utf8(bytes) {
+        Ok(s) => s,
+        Err(e) => String::from_utf8_lossy(e.as_bytes()).into_owned(),
+    }
+}
+
 /// Metadata about a commit.
 #[derive(Debug, Clone)]
 pub struct CommitInfo {
@@ -24,9 +41,23 @@ pub trait GitOps: Send + Sync {
     /// Get the diff for a single commit.
     fn diff(&self, commit: &str) -> Result<Vec<FileDiff>, GitError>;
 
+    /// Paths changed by a commit (the new path for renames), without hunks.
+    /// Backends that can list paths without producing the full patch should
+    /// override this; the default takes them from `diff`.
+    fn changed_files(&self, commit: &str) -> Result<Vec<String>, GitError> {
+        Ok(self.diff(commit)?.into_iter().map(|d| d.path).collect())
+    }
+
     /// Read a git note from the chronicle notes ref.
     fn note_read(&self, commit: &str) -> Result<Option<String>, GitError>;
 
+    /// Read notes for many commits at once. Returns one entry per input
+    /// commit, in the same order. Backends that can batch lookups should
+    /// override this; the default calls `note_read` for each commit.
+    fn note_read_batch(&self, commits: &[String]) -> Result<Vec<Option<String>>, GitError> {
+        commits.iter().map(|c| self.note_read(c)).collect()
+    }
+
     /// Write a git note to the chronicle notes ref (overwrites existing).
     fn note_write(&self, commit: &str, content: &str) -> Result<(), GitError>;
 
@@ -45,6 +76,12 @@ pub trait GitOps: Send + Sync {
     /// Read a git config value.
     fn config_get(&self, key: &str) -> Result<Option<String>, GitError>;
 
+    /// Read several git config values at once, in the same order as `keys`.
+    /// The default calls `config_get` for each key.
+    fn config_get_many(&self, keys: &[&str]) -> Result<Vec<Option<String>>, GitError> {
+        keys.iter().map(|k| self.config_get(k)).collect()
+    }
+
     /// Set a git config value.
     fn config_set(&self, key: &str, value: &str) -> Result<(), GitError>;
 
@@ -1,4 +1,4 @@
-use crate::annotate::squash::{migrate_amend_annotation, AmendMigrationContext};
+use crate::annotate::squash::{amend_diff_text, migrate_amend_annotation, AmendMigrationContext};
 use crate::error::chronicle_error::{GitSnafu, JsonSnafu};
 use crate::error::Result;
 use crate::git::GitOps;
@@ -71,13 +71,7 @@ fn handle_single_amend(git_ops: &dyn GitOps, old_sha: &str, new_sha: &str) -> Re
     let old_diffs = git_ops.diff(old_sha).context(GitSnafu)?;
 
     // Simple heuristic: if the diffs have the same content, it's message-only
-    let new_diff_text = format!("{:?}", new_diffs);
-    let old_diff_text = format!("{:?}", old_diffs);
-    let diff_for_migration = if new_diff_text == old_diff_text {
-        String::new() // message-only amend
-    } else {
-        new_diff_text
-    };
+    let diff_for_migration = amend_diff_text(&new_diffs, &old_diffs);
 
     let ctx = AmendMigrationContext {
         new_commit: new_sha.to_string(),
@@ -102,15 +96,13 @@ pub fn parse_rewrite_mappings(input: &str) -> Vec<RewriteMapping> {
     input
         .lines()
         .filter_map(|line| {
-            let parts: Vec<&str> = line.split_whitespace().collect();
-            if parts.len() >= 2 {
-                Some(RewriteMapping {
-                    old_sha: parts[0].to_string(),
-                    new_sha: parts[1].to_string(),
-                })
-            } else {
-                None
-            }
+            let mut parts = line.split_whitespace();
+            let old_sha = parts.next()?;
+            let new_sha = parts.next()?;
+            Some(RewriteMapping {
+                old_sha: old_sha.to_string(),
+                new_sha: new_sha.to_string(),
+            })
         })
         .collect()
 }
@@ -1,10 +1,11 @@
+use std::collections::HashSet;
 use std::io::BufRead;
 
 use crate::error::chronicle_error::GitSnafu;
 use crate::error::Result;
-use crate::export::ExportEntry;
-use crate::git::GitOps;
+use crate::git::{is_full_sha, GitOps};
 use crate::schema;
+use serde_json::value::RawValue;
 use snafu::ResultExt;
 
 /// Summary of an import operation.
@@ -16,6 +17,21 @@ pub struct ImportSummary {
     pub skipped_invalid: usize,
 }
 
+/// An `ExportEntry` line as read back by import.
+///
+/// The annotation is borrowed as its raw JSON text instead of being built
+/// into a `serde_json::Value` and re-serialized: it is only validated and
+/// written back out, so the tree would be thrown away immediately.
+#[derive(serde::Deserialize)]
+struct ImportEntry<'a> {
+    commit_sha: String,
+    /// Required, but never read; skipped without allocating.
+    #[serde(rename = "timestamp")]
+    _timestamp: serde::de::IgnoredAny,
+    #[serde(borrow)]
+    annotation: &'a RawValue,
+}
+
 /// Import annotations from a JSONL reader.
 ///
 /// Each line is an `ExportEntry` JSON object. For each entry:
@@ -25,7 +41,7 @@ pub struct ImportSummary {
 /// 4. Otherwise skip.
 pub fn import_annotations<R: BufRead>(
     git_ops: &dyn GitOps,
-    reader: R,
+    mut reader: R,
     force: bool,
     dry_run: bool,
 ) -> Result<ImportSummary> {
@@ -36,18 +52,39 @@ pub fn import_annotations<R: BufRead>(
         skipped_invalid: 0,
     };
 
-    for line in reader.lines() {
-        let line = line.map_err(|e| crate::error::ChronicleError::Io {
-            source: e,
-            location: snafu::Location::default(),
-        })?;
+    // Which commits already have notes, from one `notes list` up front
+    // rather than a `notes show` per entry. Kept up to date as we write, so
+    // a commit repeated later in the stream is still skipped.
+    let mut annotated: HashSet<String> = if force {
+        HashSet::new()
+    } else {
+        git_ops
+            .list_annotated_commits(u32::MAX)
+            .context(GitSnafu)?
+            .into_iter()
+            .collect()
+    };
 
-        let line = line.trim();
+    // Reuse a single line buffer across records instead of allocating one per line.
+    let mut buf = String::new();
+    loop {
+        buf.clear();
+        let read = reader
+            .read_line(&mut buf)
+            .map_err(|e| crate::error::ChronicleError::Io {
+                source: e,
+                location: snafu::Location::default(),
+            })?;
+        if read == 0 {
+            break;
+        }
+
+        let line = buf.trim();
         if line.is_empty() {
             continue;
         }
 
-        let entry: ExportEntry = match serde_json::from_str(line) {
+        let entry: ImportEntry = match serde_json::from_str(line) {
             Ok(e) => e,
             Err(_) => {
                 summary.skipped_invalid += 1;
@@ -56,8 +93,8 @@ pub fn import_annotations<R: BufRead>(
         };
 
         // Validate annotation by trying to parse it (handles both v1 and v2)
-        let annotation_json = serde_json::to_string(&entry.annotation).unwrap_or_default();
-        if schema::parse_annotation(&annotation_json).is_err() {
+        let annotation_json = entry.annotation.get();
+        if schema::parse_annotation(annotation_json).is_err() {
             summary.skipped_invalid += 1;
             continue;
         }
@@ -72,7 +109,9 @@ pub fn import_annotations<R: BufRead>(
 
         // Check if note already exists
         if !force {
-            let has_note = git_ops.note_exists(&entry.commit_sha).context(GitSnafu)?;
+            let has_note = annotated.contains(&entry.commit_sha)
+                || (!is_full_sha(&entry.commit_sha)
+                    && git_ops.note_exists(&entry.commit_sha).context(GitSnafu)?);
             if has_note {
                 summary.skipped_existing += 1;
                 continue;
@@ -82,8 +121,11 @@ pub fn import_annotations<R: BufRead>(
         if !dry_run {
             // Write the raw annotation JSON (preserving original format)
             git_ops
-                .note_write(&entry.commit_sha, &annotation_json)
+                .note_write(&entry.commit_sha, annotation_json)
                 .context(GitSnafu)?;
+            if !force {
+                annotated.insert(entry.commit_sha);
+            }
         }
 
         summary.imported += 1;
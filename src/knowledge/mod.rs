@@ -81,8 +81,10 @@ fn scope_matches(scope: &str, file: &str) -> bool {
     if scope_normalized.ends_with('/') {
         file_normalized.starts_with(scope_normalized)
     } else {
-        file_normalized == scope_normalized
-            || file_normalized.starts_with(&format!("{scope_normalized}/"))
+        // Exact match, or `scope` is a directory component prefix of `file`.
+        file_normalized
+            .strip_prefix(scope_normalized)
+            .is_some_and(|rest| rest.is_empty() || rest.starts_with('/'))
     }
 }
 
@@ -295,6 +297,14 @@ mod tests {
         assert!(scope_matches("./src/", "src/foo.rs"));
     }
 
+    #[test]
+    fn test_scope_matches_module_without_trailing_slash() {
+        assert!(scope_matches("src/git", "src/git"));
+        assert!(scope_matches("src/git", "src/git/cli_ops.rs"));
+        assert!(!scope_matches("src/git", "src/gitops.rs"));
+        assert!(!scope_matches("src/git", "src/gi"));
+    }
+
     #[test]
     fn test_filter_boundaries_by_module() {
         let store = KnowledgeStore {
@@ -71,8 +71,9 @@ pub fn query_contracts(
     let mut best_deps: std::collections::HashMap<String, DependencyEntry> =
         std::collections::HashMap::new();
 
-    for sha in &shas {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&shas)?;
+    for (sha, note) in shas.iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
@@ -150,17 +151,7 @@ pub fn query_contracts(
     })
 }
 
-use super::matching::file_matches;
-
-/// Parse dependency content from the migration format:
-/// "Depends on {file}:{anchor} — {assumption}"
-/// Returns (target_file, target_anchor, assumption) if matched.
-fn parse_dependency_content(content: &str) -> Option<(&str, &str, &str)> {
-    let rest = content.strip_prefix("Depends on ")?;
-    let (target, assumption) = rest.split_once(" — ")?;
-    let (target_file, target_anchor) = target.split_once(':')?;
-    Some((target_file, target_anchor, assumption))
-}
+use super::matching::{file_matches, parse_dependency_content};
 
 #[cfg(test)]
 mod tests {
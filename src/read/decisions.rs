@@ -67,8 +67,9 @@ pub fn query_decisions(
     let mut best_rejected: std::collections::HashMap<String, RejectedAlternativeEntry> =
         std::collections::HashMap::new();
 
-    for sha in &shas {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&shas)?;
+    for (sha, note) in shas.iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
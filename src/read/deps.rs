@@ -57,8 +57,9 @@ pub fn find_dependents(git: &dyn GitOps, query: &DepsQuery) -> Result<DepsOutput
 
     let mut dependents: Vec<DependentEntry> = Vec::new();
 
-    for sha in &annotated {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&annotated)?;
+    for (sha, note) in annotated.iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
@@ -116,15 +117,6 @@ pub fn find_dependents(git: &dyn GitOps, query: &DepsQuery) -> Result<DepsOutput
     })
 }
 
-/// Parse dependency content from the migration format:
-/// "Depends on {file}:{anchor} — {assumption}"
-fn parse_dependency_content(content: &str) -> Option<(&str, &str, &str)> {
-    let rest = content.strip_prefix("Depends on ")?;
-    let (target, assumption) = rest.split_once(" — ")?;
-    let (target_file, target_anchor) = target.split_once(':')?;
-    Some((target_file, target_anchor, assumption))
-}
-
 /// Check if a dependency's target matches the queried file+anchor.
 fn dep_matches(
     target_file: &str,
@@ -141,7 +133,7 @@ fn dep_matches(
     }
 }
 
-use super::matching::{anchor_matches, file_matches};
+use super::matching::{anchor_matches, file_matches, parse_dependency_content};
 
 /// Deduplicate dependents by (file, anchor), keeping the first occurrence
 /// (which is the most recent since we scan newest-first from list_annotated_commits).
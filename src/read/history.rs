@@ -64,8 +64,9 @@ pub fn build_timeline(git: &dyn GitOps, query: &HistoryQuery) -> Result<HistoryO
 
     let mut entries: Vec<TimelineEntry> = Vec::new();
 
-    for sha in &shas {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&shas)?;
+    for (sha, note) in shas.iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
@@ -29,6 +29,10 @@ pub struct FollowUpEntry {
 }
 
 /// Build a composite context view for a file (contracts + decisions + history + follow-ups).
+///
+/// Every section walks the same file log and notes, so callers should pass a
+/// [`CachedGitOps`](crate::git::CachedGitOps); it is not wrapped here so a
+/// caller that already holds one can share it with its other queries.
 pub fn build_lookup(
     git: &dyn GitOps,
     file: &str,
@@ -65,12 +69,12 @@ pub fn build_lookup(
     let follow_ups = collect_follow_ups(git, file)?;
 
     // 5. Staleness: for recent annotated commits, compute how stale each is
-    let mut staleness_infos = Vec::new();
-    for entry in &history_out.timeline {
-        if let Some(info) = staleness::compute_staleness(git, file, &entry.commit)? {
-            staleness_infos.push(info);
-        }
-    }
+    let timeline_commits: Vec<&str> = history_out
+        .timeline
+        .iter()
+        .map(|entry| entry.commit.as_str())
+        .collect();
+    let staleness_infos = staleness::compute_staleness_for_commits(git, file, &timeline_commits)?;
 
     // 6. Knowledge: filter store by file scope (best-effort, don't fail lookup)
     let knowledge_filtered = knowledge::read_store(git)
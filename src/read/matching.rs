@@ -19,6 +19,16 @@ pub(crate) fn anchor_matches(region_anchor: &str, query_anchor: &str) -> bool {
     region_short == query_anchor || region_anchor == query_short || region_short == query_short
 }
 
+/// Parse dependency content from the migration format:
+/// "Depends on {file}:{anchor} — {assumption}"
+/// Returns (target_file, target_anchor, assumption) if matched.
+pub(crate) fn parse_dependency_content(content: &str) -> Option<(&str, &str, &str)> {
+    let rest = content.strip_prefix("Depends on ")?;
+    let (target, assumption) = rest.split_once(" — ")?;
+    let (target_file, target_anchor) = target.split_once(':')?;
+    Some((target_file, target_anchor, assumption))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -64,4 +74,17 @@ mod tests {
     fn test_anchor_no_match() {
         assert!(!anchor_matches("other_fn", "max_sessions"));
     }
+
+    #[test]
+    fn test_parse_dependency_content() {
+        assert_eq!(
+            parse_dependency_content("Depends on src/tls.rs:max_sessions — returns a usize"),
+            Some(("src/tls.rs", "max_sessions", "returns a usize"))
+        );
+        assert_eq!(parse_dependency_content("Watch out for src/tls.rs"), None);
+        assert_eq!(
+            parse_dependency_content("Depends on src/tls.rs — no anchor"),
+            None
+        );
+    }
 }
@@ -18,8 +18,9 @@ pub fn retrieve_annotations(
     let shas = git.log_for_file(&query.file)?;
     let mut matched = Vec::new();
 
-    for sha in &shas {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&shas)?;
+    for (sha, note) in shas.into_iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
@@ -32,9 +33,12 @@ pub fn retrieve_annotations(
             }
         };
 
+        // The parsed annotation is owned, so move the matching entries and
+        // fields out of it instead of cloning them.
+        let provenance = annotation.provenance.source.to_string();
         let filtered_wisdom: Vec<v3::WisdomEntry> = annotation
             .wisdom
-            .iter()
+            .into_iter()
             .filter(|w| w.file.as_ref().is_none_or(|f| file_matches(f, &query.file)))
             .filter(|w| {
                 query.lines.as_ref().is_none_or(|line_range| {
@@ -44,15 +48,14 @@ pub fn retrieve_annotations(
                     })
                 })
             })
-            .cloned()
             .collect();
 
         matched.push(MatchedAnnotation {
-            commit: sha.clone(),
-            timestamp: annotation.timestamp.clone(),
-            summary: annotation.summary.clone(),
+            commit: sha,
+            timestamp: annotation.timestamp,
+            summary: annotation.summary,
             wisdom: filtered_wisdom,
-            provenance: annotation.provenance.source.to_string(),
+            provenance,
         });
     }
 
@@ -47,8 +47,9 @@ pub fn query_sentiments(
 
     let mut sentiments = Vec::new();
 
-    for sha in &shas {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&shas)?;
+    for (sha, note) in shas.iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
@@ -1,5 +1,7 @@
+use std::collections::{BTreeSet, HashMap};
+
 use crate::error::GitError;
-use crate::git::GitOps;
+use crate::git::{CachedGitOps, GitOps};
 
 /// Default threshold: an annotation is considered stale if more than 5
 /// commits have touched the file since the annotation was written.
@@ -33,47 +35,84 @@ pub fn compute_staleness_with_threshold(
     annotation_commit: &str,
     threshold: usize,
 ) -> Result<Option<StalenessInfo>, GitError> {
+    let shas = git.log_for_file(file)?;
+    // shas are ordered newest-first, so position 0 = HEAD of the file.
+    let position = shas.iter().position(|sha| sha == annotation_commit);
+    Ok(staleness_at(&shas, position, annotation_commit, threshold))
+}
+
+/// Compute staleness for several annotation commits on the same file.
+///
+/// Reads the file's history once and indexes commit positions, instead of
+/// re-reading and re-scanning the log for each annotation.
+pub fn compute_staleness_for_commits(
+    git: &dyn GitOps,
+    file: &str,
+    annotation_commits: &[&str],
+) -> Result<Vec<StalenessInfo>, GitError> {
     let shas = git.log_for_file(file)?;
     if shas.is_empty() {
-        return Ok(None);
+        return Ok(Vec::new());
     }
 
-    let latest = shas[0].clone();
+    let mut positions: HashMap<&str, usize> = HashMap::with_capacity(shas.len());
+    for (pos, sha) in shas.iter().enumerate() {
+        // Keep the newest position if a sha somehow repeats.
+        positions.entry(sha.as_str()).or_insert(pos);
+    }
 
-    // Find the position of the annotation commit in the file's history.
-    // shas are ordered newest-first, so position 0 = HEAD of the file.
-    let position = shas.iter().position(|sha| sha == annotation_commit);
+    Ok(annotation_commits
+        .iter()
+        .filter_map(|commit| {
+            let position = positions.get(commit).copied();
+            staleness_at(&shas, position, commit, DEFAULT_STALENESS_THRESHOLD)
+        })
+        .collect())
+}
+
+fn staleness_at(
+    shas: &[String],
+    position: Option<usize>,
+    annotation_commit: &str,
+    threshold: usize,
+) -> Option<StalenessInfo> {
+    let latest = shas.first()?.clone();
 
     match position {
-        Some(pos) => Ok(Some(StalenessInfo {
+        Some(pos) => Some(StalenessInfo {
             annotation_commit: annotation_commit.to_string(),
             latest_file_commit: latest,
             commits_since: pos,
             stale: pos > threshold,
-        })),
+        }),
         None => {
             // Annotation commit not found in file history — could be
             // a renamed file or the commit didn't touch this file directly.
             // Treat as stale (the annotation is about a different version).
-            Ok(Some(StalenessInfo {
+            Some(StalenessInfo {
                 annotation_commit: annotation_commit.to_string(),
                 latest_file_commit: latest,
                 commits_since: shas.len(),
                 stale: true,
-            }))
+            })
         }
     }
 }
 
 /// Scan annotated commits and report staleness across the repo.
 pub fn scan_staleness(git: &dyn GitOps, limit: u32) -> Result<StalenessReport, GitError> {
+    // Many annotations touch the same files; read each file's log once.
+    let cached = CachedGitOps::new(git);
+    let git: &dyn GitOps = &cached;
+
     let annotated = git.list_annotated_commits(limit)?;
     let mut total_annotations = 0usize;
     let mut stale_count = 0usize;
     let mut stale_files: Vec<StaleFileEntry> = Vec::new();
 
-    for sha in &annotated {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&annotated)?;
+    for (sha, note) in annotated.iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
@@ -89,20 +128,20 @@ pub fn scan_staleness(git: &dyn GitOps, limit: u32) -> Result<StalenessReport, G
         total_annotations += 1;
 
         // In v3, files come from wisdom entries (no narrative.files_changed).
-        let files: Vec<String> = annotation
+        // Borrow the paths into one ordered set rather than cloning them into
+        // a HashSet and then a Vec.
+        let files: BTreeSet<&str> = annotation
             .wisdom
             .iter()
-            .filter_map(|w| w.file.clone())
-            .collect::<std::collections::HashSet<_>>()
-            .into_iter()
+            .filter_map(|w| w.file.as_deref())
             .collect();
 
-        for file in &files {
+        for file in files {
             if let Some(info) = compute_staleness(git, file, &annotation.commit)? {
                 if info.stale {
                     stale_count += 1;
                     stale_files.push(StaleFileEntry {
-                        file: file.clone(),
+                        file: file.to_string(),
                         annotation_commit: annotation.commit.clone(),
                         commits_since: info.commits_since,
                     });
@@ -298,4 +337,48 @@ mod tests {
         assert_eq!(info.commits_since, 2);
         assert!(info.stale); // 2 > 1
     }
+
+    #[test]
+    fn test_staleness_for_commits_matches_single() {
+        let git = MockGitOps {
+            file_log: vec![
+                "c7".to_string(),
+                "c6".to_string(),
+                "c5".to_string(),
+                "c4".to_string(),
+                "c3".to_string(),
+                "c2".to_string(),
+                "c1".to_string(),
+                "c0".to_string(),
+            ],
+            annotated_commits: vec![],
+            notes: std::collections::HashMap::new(),
+        };
+
+        let infos =
+            compute_staleness_for_commits(&git, "src/main.rs", &["c7", "c0", "missing"]).unwrap();
+        assert_eq!(infos.len(), 3);
+        for info in &infos {
+            let single = compute_staleness(&git, "src/main.rs", &info.annotation_commit)
+                .unwrap()
+                .unwrap();
+            assert_eq!(info.commits_since, single.commits_since);
+            assert_eq!(info.stale, single.stale);
+        }
+        assert_eq!(infos[0].commits_since, 0);
+        assert!(infos[1].stale);
+        assert_eq!(infos[2].commits_since, 8);
+    }
+
+    #[test]
+    fn test_staleness_for_commits_empty_file_log() {
+        let git = MockGitOps {
+            file_log: vec![],
+            annotated_commits: vec![],
+            notes: std::collections::HashMap::new(),
+        };
+
+        let infos = compute_staleness_for_commits(&git, "src/main.rs", &["c0"]).unwrap();
+        assert!(infos.is_empty());
+    }
 }
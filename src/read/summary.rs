@@ -79,8 +79,9 @@ pub fn build_summary(git: &dyn GitOps, query: &SummaryQuery) -> Result<SummaryOu
     let mut best: std::collections::HashMap<String, AnchorAccumulator> =
         std::collections::HashMap::new();
 
-    for sha in &shas {
-        let note = match git.note_read(sha)? {
+    let notes = git.note_read_batch(&shas)?;
+    for (sha, note) in shas.iter().zip(notes) {
+        let note = match note {
             Some(n) => n,
             None => continue,
         };
@@ -106,29 +107,29 @@ pub fn build_summary(git: &dyn GitOps, query: &SummaryQuery) -> Result<SummaryOu
                 continue;
             }
 
-            let key = entry_file.clone();
-
             // Skip if we already have a newer entry for this file key
-            if best.contains_key(&key) {
+            if best.contains_key(entry_file) {
                 continue;
             }
 
-            let lines = w.lines.unwrap_or(LineRange { start: 0, end: 0 });
-
-            let acc = commit_groups
-                .entry(key)
-                .or_insert_with(|| AnchorAccumulator {
-                    anchor: SummaryAnchor {
-                        unit_type: "file".to_string(),
-                        name: entry_file.clone(),
-                        signature: None,
-                    },
-                    lines,
-                    intent: annotation.summary.clone(),
-                    constraints: vec![],
-                    risk_notes: None,
-                    timestamp: annotation.timestamp.clone(),
-                });
+            // Only clone the file key the first time this commit mentions it.
+            let acc = match commit_groups.get_mut(entry_file.as_str()) {
+                Some(acc) => acc,
+                None => commit_groups
+                    .entry(entry_file.clone())
+                    .or_insert(AnchorAccumulator {
+                        anchor: SummaryAnchor {
+                            unit_type: "file".to_string(),
+                            name: entry_file.clone(),
+                            signature: None,
+                        },
+                        lines: w.lines.unwrap_or(LineRange { start: 0, end: 0 }),
+                        intent: annotation.summary.clone(),
+                        constraints: vec![],
+                        risk_notes: None,
+                        timestamp: annotation.timestamp.clone(),
+                    }),
+            };
 
             match w.category {
                 v3::WisdomCategory::Gotcha => {
@@ -137,12 +138,15 @@ pub fn build_summary(git: &dyn GitOps, query: &SummaryQuery) -> Result<SummaryOu
                     }
                 }
                 _ => {
-                    // Other wisdom categories contribute to risk_notes
-                    let note = w.content.clone();
-                    acc.risk_notes = Some(match acc.risk_notes.take() {
-                        Some(existing) => format!("{existing}; {note}"),
-                        None => note,
-                    });
+                    // Other wisdom categories contribute to risk_notes.
+                    // Append in place rather than re-formatting the whole
+                    // accumulated string for every entry.
+                    if let Some(ref mut existing) = acc.risk_notes {
+                        existing.push_str("; ");
+                        existing.push_str(&w.content);
+                    } else {
+                        acc.risk_notes = Some(w.content.clone());
+                    }
                 }
             }
         }
@@ -632,4 +636,41 @@ mod tests {
         // No constraints/risk/deps = no markers = no units (this is expected in v2)
         assert!(result.units.is_empty());
     }
+
+    #[test]
+    fn test_summary_joins_risk_notes_in_order() {
+        let note = r#"{
+            "schema": "chronicle/v3",
+            "commit": "commit1",
+            "timestamp": "2025-01-01T00:00:00Z",
+            "summary": "Rework startup",
+            "wisdom": [
+                {"category": "insight", "content": "config loads first", "file": "src/main.rs"},
+                {"category": "dead_end", "content": "lazy init raced", "file": "src/main.rs"},
+                {"category": "unfinished_thread", "content": "retry is TODO", "file": "src/main.rs"}
+            ],
+            "provenance": {"source": "live"}
+        }"#;
+
+        let mut notes = std::collections::HashMap::new();
+        notes.insert("commit1".to_string(), note.to_string());
+
+        let git = MockGitOps {
+            file_log: vec!["commit1".to_string()],
+            notes,
+        };
+
+        let query = SummaryQuery {
+            file: "src/main.rs".to_string(),
+            anchor: None,
+        };
+
+        let result = build_summary(&git, &query).unwrap();
+        assert_eq!(result.units.len(), 1);
+        assert!(result.units[0].constraints.is_empty());
+        assert_eq!(
+            result.units[0].risk_notes.as_deref(),
+            Some("config loads first; lazy init raced; retry is TODO")
+        );
+    }
 }
@@ -60,17 +60,17 @@ pub fn resolve_author(git: &dyn crate::git::GitOps) -> String {
         }
     }
 
-    // Fall back to git user.name + user.email
-    let name = git
-        .config_get("user.name")
-        .ok()
-        .flatten()
-        .unwrap_or_default();
-    let email = git
-        .config_get("user.email")
-        .ok()
-        .flatten()
-        .unwrap_or_default();
+    // Fall back to git user.name + user.email, read in a single call
+    let (name, email) = match git.config_get_many(&["user.name", "user.email"]) {
+        Ok(values) => {
+            let mut values = values.into_iter();
+            (
+                values.next().flatten().unwrap_or_default(),
+                values.next().flatten().unwrap_or_default(),
+            )
+        }
+        Err(_) => (String::new(), String::new()),
+    };
 
     if !name.is_empty() && !email.is_empty() {
         format!("{name} <{email}>")
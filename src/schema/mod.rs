@@ -23,6 +23,16 @@ pub use v3::*;
 /// annotations from git notes should call this instead of using
 /// `serde_json::from_str` directly.
 pub fn parse_annotation(json: &str) -> Result<v3::Annotation, ParseAnnotationError> {
+    // Nearly every note is already v3, so parse it directly and only pay for
+    // a separate version peek when the document turns out to be something
+    // else. The schema check guards against older documents whose fields
+    // happen to fit the v3 shape.
+    if let Ok(ann) = serde_json::from_str::<v3::Annotation>(json) {
+        if ann.schema == "chronicle/v3" {
+            return Ok(ann);
+        }
+    }
+
     // Peek at the schema field to determine version.
     let peek: SchemaVersion =
         serde_json::from_str(json).map_err(|e| ParseAnnotationError::InvalidJson { source: e })?;
@@ -74,9 +74,11 @@ fn home_dir() -> Result<PathBuf, SetupError> {
 fn verify_binary_on_path() -> Result<(), SetupError> {
     match std::process::Command::new("git-chronicle")
         .arg("--version")
-        .output()
+        .stdout(std::process::Stdio::null())
+        .stderr(std::process::Stdio::null())
+        .status()
     {
-        Ok(output) if output.status.success() => Ok(()),
+        Ok(status) if status.success() => Ok(()),
         _ => BinaryNotFoundSnafu.fail(),
     }
 }
@@ -101,9 +103,7 @@ fn install_skills(home: &Path, options: &SetupOptions) -> Result<Vec<PathBuf>, S
                     path: parent.display().to_string(),
                 })?;
             }
-            std::fs::write(&full_path, content).context(WriteFileSnafu {
-                path: full_path.display().to_string(),
-            })?;
+            write_if_changed(&full_path, content.as_bytes(), options.force)?;
         }
         installed.push(full_path);
     }
@@ -137,9 +137,7 @@ fn install_hooks(home: &Path, options: &SetupOptions) -> Result<Vec<PathBuf>, Se
                     path: parent.display().to_string(),
                 })?;
             }
-            std::fs::write(&full_path, content).context(WriteFileSnafu {
-                path: full_path.display().to_string(),
-            })?;
+            write_if_changed(&full_path, content.as_bytes(), options.force)?;
 
             #[cfg(unix)]
             {
@@ -192,13 +190,32 @@ fn update_claude_md(home: &Path, options: &SetupOptions) -> Result<bool, SetupEr
     let snippet = embedded::CLAUDE_MD_SNIPPET;
     let new_content = apply_marker_content(&existing, snippet);
 
-    std::fs::write(&claude_md_path, &new_content).context(WriteFileSnafu {
-        path: claude_md_path.display().to_string(),
-    })?;
+    // Re-running setup usually produces identical content; skip the rewrite.
+    if new_content != existing || options.force {
+        std::fs::write(&claude_md_path, &new_content).context(WriteFileSnafu {
+            path: claude_md_path.display().to_string(),
+        })?;
+    }
 
     Ok(true)
 }
 
+/// Write `content` to `path` unless the file already holds exactly these
+/// bytes. The embedded files are static, so repeat setups are mostly no-ops.
+/// `force` always rewrites.
+fn write_if_changed(path: &Path, content: &[u8], force: bool) -> Result<(), SetupError> {
+    if !force {
+        if let Ok(existing) = std::fs::read(path) {
+            if existing == content {
+                return Ok(());
+            }
+        }
+    }
+    std::fs::write(path, content).context(WriteFileSnafu {
+        path: path.display().to_string(),
+    })
+}
+
 /// Apply marker-delimited content to a string.
 /// - If markers exist, replace content between them.
 /// - If no markers, append the content.
@@ -287,4 +304,21 @@ mod tests {
         let second = apply_marker_content(&first, snippet);
         assert_eq!(first, second);
     }
+
+    #[test]
+    fn test_write_if_changed() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("SKILL.md");
+
+        write_if_changed(&path, b"v1", false).unwrap();
+        assert_eq!(std::fs::read(&path).unwrap(), b"v1");
+
+        // Identical content is left alone; new content is written.
+        write_if_changed(&path, b"v1", false).unwrap();
+        assert_eq!(std::fs::read(&path).unwrap(), b"v1");
+        write_if_changed(&path, b"v2", false).unwrap();
+        assert_eq!(std::fs::read(&path).unwrap(), b"v2");
+        write_if_changed(&path, b"v2", true).unwrap();
+        assert_eq!(std::fs::read(&path).unwrap(), b"v2");
+    }
 }
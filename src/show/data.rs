@@ -135,7 +135,8 @@ fn convert_to_region_refs(annotations: Vec<MatchedAnnotation>, file_path: &str)
     for ann in annotations {
         if ann.wisdom.is_empty() {
             // No wisdom entries — create a synthetic commit-level region.
-            let key = format!("{}:{}", file_path, "__commit_level__");
+            // Keys are already scoped to `file_path`, so no per-entry prefix is needed.
+            let key = String::from("__commit_level__");
             let region_ref = RegionRef {
                 region: RegionAnnotation {
                     file: file_path.to_string(),
@@ -165,10 +166,7 @@ fn convert_to_region_refs(annotations: Vec<MatchedAnnotation>, file_path: &str)
                     synthesis_notes: None,
                 },
             };
-            let existing = best.get(&key);
-            if existing.is_none() || region_ref.timestamp > existing.unwrap().timestamp {
-                best.insert(key, region_ref);
-            }
+            keep_newest(&mut best, key, region_ref);
             continue;
         }
 
@@ -180,27 +178,18 @@ fn convert_to_region_refs(annotations: Vec<MatchedAnnotation>, file_path: &str)
         }
 
         for (wf, entries) in wisdom_by_file {
-            let key = format!("{}:{}", file_path, wf);
-
-            // Determine line range from wisdom entries
+            // Single pass: determine the line range and map wisdom categories
+            // to v1-style fields.
             let mut line_start = u32::MAX;
             let mut line_end = 0u32;
+            let mut constraints = Vec::new();
+            let mut risk_notes = Vec::new();
+
             for w in &entries {
                 if let Some(ref lines) = w.lines {
                     line_start = line_start.min(lines.start);
                     line_end = line_end.max(lines.end);
                 }
-            }
-            if line_start == u32::MAX {
-                line_start = 1;
-                line_end = 1;
-            }
-
-            // Map wisdom categories to v1-style fields
-            let mut constraints = Vec::new();
-            let mut risk_notes = Vec::new();
-
-            for w in &entries {
                 match w.category {
                     v3::WisdomCategory::Gotcha => {
                         constraints.push(Constraint {
@@ -213,6 +202,10 @@ fn convert_to_region_refs(annotations: Vec<MatchedAnnotation>, file_path: &str)
                     }
                 }
             }
+            if line_start == u32::MAX {
+                line_start = 1;
+                line_end = 1;
+            }
 
             let region_ref = RegionRef {
                 region: RegionAnnotation {
@@ -251,10 +244,7 @@ fn convert_to_region_refs(annotations: Vec<MatchedAnnotation>, file_path: &str)
                 },
             };
 
-            let existing = best.get(&key);
-            if existing.is_none() || region_ref.timestamp > existing.unwrap().timestamp {
-                best.insert(key, region_ref);
-            }
+            keep_newest(&mut best, wf, region_ref);
         }
     }
 
@@ -263,6 +253,27 @@ fn convert_to_region_refs(annotations: Vec<MatchedAnnotation>, file_path: &str)
     regions
 }
 
+/// Insert `region_ref` under `key` unless a newer region is already there.
+/// Uses the entry API so each candidate costs a single hash lookup.
+fn keep_newest(
+    best: &mut std::collections::HashMap<String, RegionRef>,
+    key: String,
+    region_ref: RegionRef,
+) {
+    use std::collections::hash_map::Entry;
+
+    match best.entry(key) {
+        Entry::Occupied(mut slot) => {
+            if region_ref.timestamp > slot.get().timestamp {
+                slot.insert(region_ref);
+            }
+        }
+        Entry::Vacant(slot) => {
+            slot.insert(region_ref);
+        }
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -170,9 +170,10 @@ mod views {
     fn render_source(f: &mut Frame, app: &AppState, area: Rect) {
         let visible_height = area.height as usize;
         let line_count = app.data.source_lines.len();
-        let line_num_width = format!("{}", line_count).len();
+        // Digit count of the largest line number, without formatting it.
+        let line_num_width = line_count.max(1).ilog10() as usize + 1;
 
-        let mut lines: Vec<Line> = Vec::new();
+        let mut lines: Vec<Line> = Vec::with_capacity(visible_height.min(line_count));
 
         for i in app.scroll_offset..line_count.min(app.scroll_offset + visible_height) {
             let line_num = i + 1;
@@ -4,6 +4,7 @@ use std::process::Command;
 use crate::error::chronicle_error::GitSnafu;
 use crate::error::git_error::CommandFailedSnafu;
 use crate::error::{GitError, Result};
+use crate::git::into_string;
 use snafu::ResultExt;
 
 const NOTES_REF: &str = "refs/notes/chronicle";
@@ -34,21 +35,10 @@ pub struct SyncStatus {
 
 /// Run a git command in the given repo directory.
 fn run_git(repo_dir: &PathBuf, args: &[&str]) -> std::result::Result<String, GitError> {
-    let output = Command::new("git")
-        .args(args)
-        .current_dir(repo_dir)
-        .output()
-        .map_err(|e| {
-            CommandFailedSnafu {
-                message: format!("failed to run git: {e}"),
-            }
-            .build()
-        })?;
-
-    if output.status.success() {
-        Ok(String::from_utf8_lossy(&output.stdout).to_string())
+    let (success, stdout, stderr) = run_git_raw(repo_dir, args)?;
+    if success {
+        Ok(stdout)
     } else {
-        let stderr = String::from_utf8_lossy(&output.stderr).to_string();
         Err(CommandFailedSnafu {
             message: stderr.trim().to_string(),
         }
@@ -72,8 +62,8 @@ fn run_git_raw(
             .build()
         })?;
 
-    let stdout = String::from_utf8_lossy(&output.stdout).to_string();
-    let stderr = String::from_utf8_lossy(&output.stderr).to_string();
+    let stdout = into_string(output.stdout);
+    let stderr = into_string(output.stderr);
     Ok((output.status.success(), stdout, stderr))
 }
 
@@ -98,71 +88,36 @@ pub fn get_sync_config(repo_dir: &PathBuf, remote: &str) -> Result<SyncConfig> {
 
 /// Enable sync by adding push/fetch refspecs for chronicle notes.
 pub fn enable_sync(repo_dir: &PathBuf, remote: &str) -> Result<()> {
-    let config = get_sync_config(repo_dir, remote)?;
+    let push_key = format!("remote.{remote}.push");
+    let fetch_key = format!("remote.{remote}.fetch");
+
+    // Read each refspec list once and check both refs against it. Adding the
+    // notes refspec can't affect the knowledge check, so re-reading config
+    // between the two would only cost extra git processes.
+    let push_values = get_config_values(repo_dir, &push_key).context(GitSnafu)?;
+    let fetch_values = get_config_values(repo_dir, &fetch_key).context(GitSnafu)?;
 
     // Add push refspec if not already present
-    if config.push_refspec.is_none() {
-        run_git(
-            repo_dir,
-            &[
-                "config",
-                "--add",
-                &format!("remote.{remote}.push"),
-                NOTES_REF,
-            ],
-        )
-        .context(GitSnafu)?;
+    if !push_values.iter().any(|r| r.contains(NOTES_REF)) {
+        run_git(repo_dir, &["config", "--add", &push_key, NOTES_REF]).context(GitSnafu)?;
     }
 
     // Add fetch refspec if not already present
-    if config.fetch_refspec.is_none() {
+    if !fetch_values.iter().any(|r| r.contains(NOTES_REF)) {
         let fetch_spec = format!("{NOTES_REF}:{NOTES_REF}");
-        run_git(
-            repo_dir,
-            &[
-                "config",
-                "--add",
-                &format!("remote.{remote}.fetch"),
-                &fetch_spec,
-            ],
-        )
-        .context(GitSnafu)?;
+        run_git(repo_dir, &["config", "--add", &fetch_key, &fetch_spec]).context(GitSnafu)?;
     }
 
     // Also configure sync for the knowledge ref
-    let knowledge_push = get_config_values(repo_dir, &format!("remote.{remote}.push"))
-        .context(GitSnafu)?
-        .into_iter()
-        .any(|r| r.contains(KNOWLEDGE_REF));
-
-    if !knowledge_push {
-        run_git(
-            repo_dir,
-            &[
-                "config",
-                "--add",
-                &format!("remote.{remote}.push"),
-                KNOWLEDGE_REF,
-            ],
-        )
-        .context(GitSnafu)?;
+    if !push_values.iter().any(|r| r.contains(KNOWLEDGE_REF)) {
+        run_git(repo_dir, &["config", "--add", &push_key, KNOWLEDGE_REF]).context(GitSnafu)?;
     }
 
-    let knowledge_fetch = get_config_values(repo_dir, &format!("remote.{remote}.fetch"))
-        .context(GitSnafu)?
-        .into_iter()
-        .any(|r| r.contains(KNOWLEDGE_REF));
-
-    if !knowledge_fetch {
+    if !fetch_values.iter().any(|r| r.contains(KNOWLEDGE_REF)) {
         let knowledge_fetch_spec = format!("{KNOWLEDGE_REF}:{KNOWLEDGE_REF}");
         run_git(
             repo_dir,
-            &[
-                "config",
-                "--add",
-                &format!("remote.{remote}.fetch"),
-                &knowledge_fetch_spec,
-            ],
+            &["config", "--add", &fetch_key, &knowledge_fetch_spec],
         )
         .context(GitSnafu)?;
     }
@@ -172,25 +127,31 @@ pub fn enable_sync(repo_dir: &PathBuf, remote: &str) -> Result<()> {
 
 /// Get the sync status for a remote.
 pub fn get_sync_status(repo_dir: &PathBuf, remote: &str) -> Result<SyncStatus> {
-    let config = get_sync_config(repo_dir, remote)?;
-    let enabled = config.is_enabled();
-
-    let local_count = count_local_notes(repo_dir).context(GitSnafu)?;
-
-    // Try to get remote note count (may fail if remote is unreachable)
-    let remote_count = count_remote_notes(repo_dir, remote).ok().flatten();
-
-    let unpushed_count = if let Some(rc) = remote_count {
-        local_count.saturating_sub(rc)
-    } else {
-        0
-    };
-
-    Ok(SyncStatus {
-        enabled,
-        local_count,
-        remote_count,
-        unpushed_count,
+    // The ls-remote round-trip to the remote dominates; start it first and
+    // read the local config and notes while it is in flight.
+    std::thread::scope(|scope| {
+        // Try to get remote note count (may fail if remote is unreachable)
+        let remote_query = scope.spawn(|| count_remote_notes(repo_dir, remote).ok().flatten());
+
+        let config = get_sync_config(repo_dir, remote)?;
+        let enabled = config.is_enabled();
+
+        let local_count = count_local_notes(repo_dir).context(GitSnafu)?;
+
+        let remote_count = remote_query.join().ok().flatten();
+
+        let unpushed_count = if let Some(rc) = remote_count {
+            local_count.saturating_sub(rc)
+        } else {
+            0
+        };
+
+        Ok(SyncStatus {
+            enabled,
+            local_count,
+            remote_count,
+            unpushed_count,
+        })
     })
 }
 
@@ -3,7 +3,7 @@ use std::path::Path;
 
 use crate::cli::status::build_status;
 use crate::error::{ChronicleError, GitError};
-use crate::git::{CliOps, GitOps};
+use crate::git::{CachedGitOps, CliOps, GitOps};
 use crate::knowledge;
 use crate::read::{decisions, history, lookup, sentiments, summary};
 
@@ -70,7 +70,13 @@ fn handle_tree(git_ops: &CliOps) -> crate::error::Result<Response> {
                 // In v3, file references come from wisdom entries.
                 for w in &ann.wisdom {
                     if let Some(f) = &w.file {
-                        *annotation_counts.entry(f.clone()).or_insert(0) += 1;
+                        // Only allocate a key the first time a file is seen.
+                        match annotation_counts.get_mut(f.as_str()) {
+                            Some(count) => *count += 1,
+                            None => {
+                                annotation_counts.insert(f.clone(), 1);
+                            }
+                        }
                     }
                 }
             }
@@ -93,6 +99,21 @@ fn handle_tree(git_ops: &CliOps) -> crate::error::Result<Response> {
     ))
 }
 
+/// Body of the file endpoints. Serialized from borrows so the file content and
+/// read results are written out directly rather than copied into a `json!` tree.
+/// Top-level fields stay alphabetical like the old `json!` body; the nested
+/// lookup and summary objects use declaration order instead of sorted keys.
+#[derive(serde::Serialize)]
+struct FileBody<'a> {
+    content: &'a str,
+    language: &'static str,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    lookup: Option<&'a lookup::LookupOutput>,
+    path: &'a str,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    summary: Option<&'a summary::SummaryOutput>,
+}
+
 fn handle_file(git_ops: &CliOps, file_path: &str) -> crate::error::Result<Response> {
     let content = git_ops
         .file_at_commit(Path::new(file_path), "HEAD")
@@ -104,11 +125,13 @@ fn handle_file(git_ops: &CliOps, file_path: &str) -> crate::error::Result<Respon
 
     Ok(json_response(
         200,
-        &serde_json::json!({
-            "path": file_path,
-            "content": content,
-            "language": language,
-        }),
+        &FileBody {
+            content: &content,
+            language,
+            lookup: None,
+            path: file_path,
+            summary: None,
+        },
     ))
 }
 
@@ -130,14 +153,17 @@ fn handle_file_view(git_ops: &CliOps, file_path: &str) -> crate::error::Result<R
     };
     let language = detect_language(file_path);
 
+    // Lookup and summary walk the same file history; share one cache.
+    let cached = CachedGitOps::new(git_ops);
+
     let lookup_result =
-        lookup::build_lookup(git_ops, file_path, None).map_err(|e| ChronicleError::Git {
+        lookup::build_lookup(&cached, file_path, None).map_err(|e| ChronicleError::Git {
             source: e,
             location: snafu::Location::default(),
         })?;
 
     let summary_result = summary::build_summary(
-        git_ops,
+        &cached,
         &summary::SummaryQuery {
             file: file_path.to_string(),
             anchor: None,
@@ -150,19 +176,20 @@ fn handle_file_view(git_ops: &CliOps, file_path: &str) -> crate::error::Result<R
 
     Ok(json_response(
         200,
-        &serde_json::json!({
-            "path": file_path,
-            "content": content,
-            "language": language,
-            "lookup": lookup_result,
-            "summary": summary_result,
-        }),
+        &FileBody {
+            content: &content,
+            language,
+            lookup: Some(&lookup_result),
+            path: file_path,
+            summary: Some(&summary_result),
+        },
     ))
 }
 
 fn handle_lookup(git_ops: &CliOps, file_path: &str, query: &str) -> crate::error::Result<Response> {
     let anchor = parse_query_param(query, "anchor");
-    let result = lookup::build_lookup(git_ops, file_path, anchor.as_deref()).map_err(|e| {
+    let cached = CachedGitOps::new(git_ops);
+    let result = lookup::build_lookup(&cached, file_path, anchor.as_deref()).map_err(|e| {
         ChronicleError::Git {
             source: e,
             location: snafu::Location::default(),
@@ -249,16 +276,16 @@ fn handle_recent_annotations(git_ops: &CliOps) -> crate::error::Result<Response>
             location: snafu::Location::default(),
         })?;
 
+    // Nothing annotated yet: skip listing the tree entirely.
+    if annotated.is_empty() {
+        return Ok(json_response(200, &Vec::<serde_json::Value>::new()));
+    }
+
     let existing_files: std::collections::HashSet<String> =
         list_files(git_ops)?.into_iter().collect();
 
     let mut entries = Vec::new();
     for sha in &annotated {
-        let info = git_ops.commit_info(sha).map_err(|e| ChronicleError::Git {
-            source: e,
-            location: snafu::Location::default(),
-        })?;
-
         let note = match git_ops.note_read(sha) {
             Ok(Some(n)) => n,
             _ => continue,
@@ -269,6 +296,12 @@ fn handle_recent_annotations(git_ops: &CliOps) -> crate::error::Result<Response>
             Err(_) => continue,
         };
 
+        // Only look up commit metadata once the note is known to be usable.
+        let info = git_ops.commit_info(sha).map_err(|e| ChronicleError::Git {
+            source: e,
+            location: snafu::Location::default(),
+        })?;
+
         let mut files: Vec<String> = ann
             .wisdom
             .iter()
@@ -303,17 +336,28 @@ fn handle_recent_annotations(git_ops: &CliOps) -> crate::error::Result<Response>
 
 fn commit_changed_files(git_ops: &CliOps, sha: &str) -> Result<Vec<String>, ChronicleError> {
     let output = std::process::Command::new("git")
-        .args(["diff-tree", "--no-commit-id", "--name-only", "-r", sha])
+        .args([
+            "diff-tree",
+            "--no-commit-id",
+            "--name-only",
+            "-r",
+            "-z",
+            sha,
+        ])
         .current_dir(&git_ops.repo_dir)
+        .stderr(std::process::Stdio::null())
         .output()
         .map_err(|e| ChronicleError::Io {
             source: e,
             location: snafu::Location::default(),
         })?;
 
+    // -z emits paths verbatim and NUL-terminated; without it git C-quotes
+    // any path with non-ASCII or control characters, which would then fail
+    // to match the paths recorded in annotations.
     let stdout = String::from_utf8_lossy(&output.stdout);
     Ok(stdout
-        .lines()
+        .split('\0')
         .filter(|l| !l.is_empty())
         .map(|s| s.to_string())
         .collect())
@@ -372,8 +416,9 @@ fn hex_val(b: u8) -> Option<u8> {
 
 fn list_files(git_ops: &CliOps) -> Result<Vec<String>, ChronicleError> {
     let output = std::process::Command::new("git")
-        .args(["ls-tree", "-r", "--name-only", "HEAD"])
+        .args(["ls-tree", "-r", "-z", "--name-only", "HEAD"])
         .current_dir(&git_ops.repo_dir)
+        .stderr(std::process::Stdio::null())
         .output()
         .map_err(|e| ChronicleError::Io {
             source: e,
@@ -392,7 +437,7 @@ fn list_files(git_ops: &CliOps) -> Result<Vec<String>, ChronicleError> {
 
     let stdout = String::from_utf8_lossy(&output.stdout);
     Ok(stdout
-        .lines()
+        .split('\0')
         .filter(|l| !l.is_empty())
         .map(|s| s.to_string())
         .collect())
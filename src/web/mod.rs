@@ -4,6 +4,22 @@ mod assets;
 use crate::error::{ChronicleError, Result};
 use crate::git::CliOps;
 
+/// Threads handling web requests when the core count can't be determined.
+const DEFAULT_WORKER_THREADS: usize = 4;
+
+/// Bounds on threads handling web requests concurrently.
+const MIN_WORKER_THREADS: usize = 2;
+const MAX_WORKER_THREADS: usize = 8;
+
+/// Worker count: one per available core, capped so a large machine doesn't
+/// fan a burst of UI requests out into dozens of parallel git processes.
+/// Handlers mostly wait on git, so even one core gets more than one worker.
+fn worker_threads() -> usize {
+    std::thread::available_parallelism()
+        .map_or(DEFAULT_WORKER_THREADS, std::num::NonZeroUsize::get)
+        .clamp(MIN_WORKER_THREADS, MAX_WORKER_THREADS)
+}
+
 pub fn serve(git_ops: CliOps, port: Option<u16>, open_browser: bool) -> Result<()> {
     let bind_port = port.unwrap_or(0);
     let listener = std::net::TcpListener::bind(("127.0.0.1", bind_port)).map_err(|e| {
@@ -32,34 +48,45 @@ pub fn serve(git_ops: CliOps, port: Option<u16>, open_browser: bool) -> Result<(
         open::that(&url).ok();
     }
 
-    for request in server.incoming_requests() {
-        let req_url = request.url().to_string();
-        let result = if req_url.starts_with("/api/") {
-            api::handle(&git_ops, &req_url)
-        } else {
-            Ok(assets::handle(&req_url))
-        };
+    // Every API request shells out to git several times, so serve requests
+    // from a small pool of workers instead of one at a time. All workers pull
+    // from the same server queue; the server and `git_ops` are shared by
+    // reference (both are Sync) for the lifetime of the scope.
+    std::thread::scope(|scope| {
+        for _ in 0..worker_threads() {
+            scope.spawn(|| {
+                for request in server.incoming_requests() {
+                    handle_request(&git_ops, request);
+                }
+            });
+        }
+    });
+
+    Ok(())
+}
+
+fn handle_request(git_ops: &CliOps, request: tiny_http::Request) {
+    let req_url = request.url().to_string();
+    let result = if req_url.starts_with("/api/") {
+        api::handle(git_ops, &req_url)
+    } else {
+        Ok(assets::handle(&req_url))
+    };
 
-        match result {
-            Ok(response) => {
-                request.respond(response).ok();
-            }
-            Err(e) => {
-                eprintln!("[chronicle-web] ERROR {req_url}: {e}");
-                let body = serde_json::json!({ "error": e.to_string() }).to_string();
-                let response = tiny_http::Response::from_string(body)
-                    .with_header(
-                        tiny_http::Header::from_bytes(
-                            &b"Content-Type"[..],
-                            &b"application/json"[..],
-                        )
+    match result {
+        Ok(response) => {
+            request.respond(response).ok();
+        }
+        Err(e) => {
+            eprintln!("[chronicle-web] ERROR {req_url}: {e}");
+            let body = serde_json::json!({ "error": e.to_string() }).to_string();
+            let response = tiny_http::Response::from_string(body)
+                .with_header(
+                    tiny_http::Header::from_bytes(&b"Content-Type"[..], &b"application/json"[..])
                         .unwrap(),
-                    )
-                    .with_status_code(500);
-                request.respond(response).ok();
-            }
+                )
+                .with_status_code(500);
+            request.respond(response).ok();
         }
     }
-
-    Ok(())
 }
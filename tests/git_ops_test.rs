@@ -94,6 +94,128 @@ fn note_write_and_read_roundtrip() {
     assert!(ops.note_exists(&sha).unwrap());
 }
 
+#[test]
+fn note_read_batch_matches_note_read() {
+    let (dir, ops) = create_temp_repo();
+    add_and_commit(dir.path(), "a.txt", "a\n", "First");
+    let first = ops.resolve_ref("HEAD").unwrap();
+    add_and_commit(dir.path(), "b.txt", "b\n", "Second");
+    let second = ops.resolve_ref("HEAD").unwrap();
+    add_and_commit(dir.path(), "c.txt", "c\n", "Third");
+    let third = ops.resolve_ref("HEAD").unwrap();
+
+    // No notes ref yet
+    let commits = vec![first.clone(), second.clone()];
+    assert_eq!(ops.note_read_batch(&commits).unwrap(), vec![None, None]);
+
+    ops.note_write(&first, "first note\nwith two lines")
+        .unwrap();
+    ops.note_write(&third, r#"{"schema":"chronicle/v3"}"#)
+        .unwrap();
+
+    let commits = vec![
+        third.clone(),
+        second.clone(),
+        first.clone(),
+        first[..7].to_string(),
+    ];
+    let batch = ops.note_read_batch(&commits).unwrap();
+    let single: Vec<Option<String>> = commits.iter().map(|c| ops.note_read(c).unwrap()).collect();
+    assert_eq!(batch, single);
+    assert!(batch[1].is_none());
+    assert!(batch[2].as_deref().unwrap().contains("with two lines"));
+}
+
+#[test]
+fn note_read_batch_reads_only_chronicle_notes() {
+    let (dir, ops) = create_temp_repo();
+    add_and_commit(dir.path(), "a.txt", "a\n", "First");
+    let sha = ops.resolve_ref("HEAD").unwrap();
+    ops.note_write(&sha, "chronicle note").unwrap();
+
+    // A second notes ref that `git log` would otherwise display as well.
+    for args in [
+        vec![
+            "notes",
+            "--ref",
+            "refs/notes/other",
+            "add",
+            "-m",
+            "other note",
+            &sha,
+        ],
+        vec!["config", "notes.displayRef", "refs/notes/other"],
+    ] {
+        Command::new("git")
+            .args(&args)
+            .current_dir(dir.path())
+            .output()
+            .unwrap();
+    }
+
+    // Duplicates and an unknown commit still come back one entry per input.
+    let unknown = "0".repeat(40);
+    let commits = vec![sha.clone(), unknown, sha.clone()];
+    let batch = ops.note_read_batch(&commits).unwrap();
+    let single: Vec<Option<String>> = commits.iter().map(|c| ops.note_read(c).unwrap()).collect();
+    assert_eq!(batch, single);
+    assert!(batch[1].is_none());
+
+    let batch = ops.note_read_batch(&[sha.clone(), sha]).unwrap();
+    assert_eq!(batch[0], batch[1]);
+    assert_eq!(batch[0].as_deref().map(str::trim), Some("chronicle note"));
+}
+
+#[cfg(unix)]
+#[test]
+fn note_read_batch_ignores_show_signature() {
+    use std::os::unix::fs::PermissionsExt;
+
+    let (dir, ops) = create_temp_repo();
+
+    // A stand-in for gpg that signs anything and reports every signature as
+    // good, so commits can be signed without a real key.
+    let gpg = dir.path().join("fake-gpg");
+    std::fs::write(
+        &gpg,
+        "#!/bin/sh\n\
+         case \" $* \" in\n\
+         *\" --verify \"*) echo 'gpg: Good signature' >&2 ;;\n\
+         *) cat >/dev/null; echo '[GNUPG:] SIG_CREATED ' >&2; \
+         printf -- '-----BEGIN PGP SIGNATURE-----\\n\\nfake\\n-----END PGP SIGNATURE-----\\n' ;;\n\
+         esac\n",
+    )
+    .unwrap();
+    std::fs::set_permissions(&gpg, std::fs::Permissions::from_mode(0o755)).unwrap();
+    for (key, value) in [
+        ("gpg.program", gpg.to_str().unwrap()),
+        ("user.signingkey", "test"),
+        ("commit.gpgSign", "true"),
+        ("log.showSignature", "true"),
+    ] {
+        Command::new("git")
+            .args(["config", key, value])
+            .current_dir(dir.path())
+            .output()
+            .unwrap();
+    }
+
+    add_and_commit(dir.path(), "a.txt", "a\n", "First");
+    let first = ops.resolve_ref("HEAD").unwrap();
+    add_and_commit(dir.path(), "b.txt", "b\n", "Second");
+    let second = ops.resolve_ref("HEAD").unwrap();
+    ops.note_write(&first, "first note").unwrap();
+    ops.note_write(&second, "second note").unwrap();
+
+    // All full shas that exist, so this goes through the batch parser rather
+    // than the per-commit fallback.
+    let commits = vec![second.clone(), first.clone()];
+    let batch = ops.note_read_batch(&commits).unwrap();
+    let single: Vec<Option<String>> = commits.iter().map(|c| ops.note_read(c).unwrap()).collect();
+    assert_eq!(batch, single);
+    assert_eq!(batch[1].as_deref().map(str::trim), Some("first note"));
+}
+
 #[test]
 fn note_write_overwrites_existing() {
     let (dir, ops) = create_temp_repo();
@@ -158,6 +280,27 @@ fn diff_returns_modifications() {
     assert!(diffs[0].added_line_count() >= 1);
 }
 
+#[test]
+fn changed_files_matches_diff_paths() {
+    let (dir, ops) = create_temp_repo();
+    add_and_commit(dir.path(), "a.txt", "a\n", "Init");
+    let root = ops.resolve_ref("HEAD").unwrap();
+    add_and_commit(dir.path(), "b.txt", "b\n", "Second");
+    let sha = ops.resolve_ref("HEAD").unwrap();
+
+    for commit in [&root, &sha] {
+        let from_diff: Vec<String> = ops
+            .diff(commit)
+            .unwrap()
+            .into_iter()
+            .map(|d| d.path)
+            .collect();
+        assert_eq!(ops.changed_files(commit).unwrap(), from_diff);
+    }
+    assert_eq!(ops.changed_files(&root).unwrap(), vec!["a.txt"]);
+    assert_eq!(ops.changed_files(&sha).unwrap(), vec!["b.txt"]);
+}
+
 #[test]
 fn config_get_set_roundtrip() {
     let (dir, ops) = create_temp_repo();
@@ -170,3 +313,26 @@ fn config_get_set_roundtrip() {
     let val = ops.config_get("chronicle.test-key").unwrap();
     assert_eq!(val, Some("test-value".to_string()));
 }
+
+#[test]
+fn config_get_many_matches_config_get() {
+    let (dir, ops) = create_temp_repo();
+    add_and_commit(dir.path(), "init.txt", "init\n", "Init");
+
+    let keys = [
+        "chronicle.enabled",
+        "chronicle.maxDiffLines",
+        "chronicle.unset",
+    ];
+    assert_eq!(ops.config_get_many(&keys).unwrap(), vec![None, None, None]);
+
+    ops.config_set("chronicle.enabled", "true").unwrap();
+    ops.config_set("chronicle.maxdifflines", "500").unwrap();
+
+    let many = ops.config_get_many(&keys).unwrap();
+    let single: Vec<Option<String>> = keys.iter().map(|k| ops.config_get(k).unwrap()).collect();
+    assert_eq!(many, single);
+    assert_eq!(many[0].as_deref(), Some("true"));
+    assert_eq!(many[1].as_deref(), Some("500"));
+    assert!(many[2].is_none());
+}
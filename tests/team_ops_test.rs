@@ -253,6 +253,28 @@ fn import_skips_existing_notes_without_force() {
     assert_eq!(summary.skipped_existing, 1);
 }
 
+#[test]
+fn import_skips_repeated_commit_in_same_stream() {
+    let (dir, ops) = create_temp_repo();
+    add_and_commit(dir.path(), "hello.txt", "hello\n", "Init");
+    let sha = ops.resolve_ref("HEAD").unwrap();
+
+    let annotation = make_test_annotation(&sha);
+    let entry = chronicle::export::ExportEntry {
+        commit_sha: sha.clone(),
+        timestamp: annotation.timestamp.clone(),
+        annotation: serde_json::to_value(&annotation).unwrap(),
+    };
+    let line = serde_json::to_string(&entry).unwrap();
+    let data = format!("{line}\n{line}\n");
+
+    // The first entry writes the note; the second sees it and is skipped
+    let reader = BufReader::new(Cursor::new(data.as_bytes()));
+    let summary = import_annotations(&ops, reader, false, false).unwrap();
+    assert_eq!(summary.imported, 1);
+    assert_eq!(summary.skipped_existing, 1);
+}
+
 #[test]
 fn import_with_force_overwrites() {
     let (dir, ops) = create_temp_repo();